@@ -0,0 +1,70 @@
+"""Compara los métodos por lotes en float64 con su versión de precisión mixta.
+
+Para cada ejercicio y método resuelve los mismos carriles con las dos
+versiones, informa los tiempos y comprueba la garantía de `raices.mixta`: los
+mismos códigos de estado y, en los carriles convergidos, raíces a menos de
+2 * tol entre sí (cada una a menos de tol de la raíz).
+
+Uso (desde codigo_python/):
+    python -m benchmarks.bench_mixta
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from raices.convenciones import CONVERGIDO, TOL
+from raices.lote import biseccion_lote, newton_lote, secante_lote
+from raices.mixta import biseccion_mixta, newton_mixta, secante_mixta
+from raices.problemas import EJERCICIOS
+
+CARRILES = 1_000_000
+
+
+def _casos(ejercicio, rng):
+    """Carriles alrededor de los datos del ejercicio: (nombre, float64, mixta, argumentos)."""
+    problema = ejercicio.problema
+    a, b = ejercicio.intervalo
+    desplazamiento = rng.uniform(-0.05, 0.05, CARRILES)
+    x_menos_1, x0 = ejercicio.iniciales_secante
+    return [
+        ("biseccion", biseccion_lote, biseccion_mixta,
+         (problema.f, a - rng.uniform(0, 0.3, CARRILES), b + rng.uniform(0, 0.3, CARRILES))),
+        ("newton", newton_lote, newton_mixta,
+         (problema.f, problema.df, ejercicio.x0 + desplazamiento)),
+        ("secante", secante_lote, secante_mixta,
+         (problema.f, x_menos_1 + desplazamiento, x0 + desplazamiento)),
+    ]
+
+
+def _tiempo(funcion, *args):
+    t0 = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - t0
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print("{:<4} {:<10} {:<8} {:<12} {:<12} {:<10} {:<14} {}".format(
+        "ej", "método", "tol", "float64 (s)", "mixta (s)", "acel.", "máx |dif|", "ok"))
+
+    todo_bien = True
+    for numero in (1, 3, 4):
+        for tol in (TOL, 1e-10):
+            for nombre, pura, mixta, args in _casos(EJERCICIOS[numero], rng):
+                r64, t64 = _tiempo(pura, *args, tol)
+                rm, tm = _tiempo(mixta, *args, tol)
+
+                convergidos = r64.estado == CONVERGIDO
+                diferencia = np.abs(r64.raiz - rm.raiz)[convergidos].max(initial=0.0)
+                ok = np.array_equal(r64.estado, rm.estado) and diferencia < 2 * tol
+                todo_bien &= ok
+                print("{:<4} {:<10} {:<8g} {:<12.3f} {:<12.3f} {:<10.1f} {:<14.2e} {}".format(
+                    numero, nombre, tol, t64, tm, t64 / tm, diferencia, "sí" if ok else "NO"))
+
+    return 0 if todo_bien else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Compara el costo por iteración: NumPy sobre escalares vs núcleos con `math`.
+
+Uso (desde codigo_python/):
+    python -m benchmarks.bench_nucleos
+"""
+
+import timeit
+
+import numpy as np
+
+from raices import iterar_newton, resultado_final
+from raices.problemas import PROBLEMAS
+
+# Las funciones tal como están en ejer1.py - ejer4.py (NumPy sobre floats)
+NUMPY_EN_ESCALARES = {
+    "exponencial": (
+        lambda x: x**3 - np.exp(0.8 * x) - 20,
+        lambda x: 3 * x**2 - 0.8 * np.exp(0.8 * x),
+    ),
+    "cubica": (
+        lambda x: x**3 - 0.5 * x**2 + 4 * x - 1,
+        lambda x: 3 * x**2 - x + 4,
+    ),
+    "coseno": (
+        lambda x: x * np.cos(x),
+        lambda x: np.cos(x) - x * np.sin(x),
+    ),
+}
+
+# Punto de partida (cerca de la raíz de cada ejercicio)
+X0 = {"exponencial": 3.5, "cubica": 0.2, "coseno": 1.5}
+
+REPETICIONES = 20000
+
+
+def paso_newton(f, df, x):
+    """Un paso de Newton con la prueba de parada, como en newton_raphson."""
+    fx = f(x)
+    dfx = df(x)
+    x_nuevo = x - fx / dfx
+    return x_nuevo, abs(x_nuevo - x)
+
+
+def medir_paso(f, df, x0):
+    """Microsegundos por paso de Newton."""
+    t = timeit.timeit(lambda: paso_newton(f, df, x0), number=REPETICIONES)
+    return t / REPETICIONES * 1e6
+
+
+def medir_resolucion(f, df, x0):
+    """Microsegundos por resolución completa (sin imprimir)."""
+    t = timeit.timeit(
+        lambda: resultado_final(iterar_newton(f, df, x0, registrar=False)),
+        number=REPETICIONES // 10,
+    )
+    return t / (REPETICIONES // 10) * 1e6
+
+
+def main():
+    print("{:<12} {:<22} {:<16} {:<16} {:<10}".format(
+        "problema", "medición", "NumPy (us)", "math (us)", "ganancia"))
+    for nombre, problema in PROBLEMAS.items():
+        f_np, df_np = NUMPY_EN_ESCALARES[nombre]
+        x0 = X0[nombre]
+        for medicion, medir in (("por iteración", medir_paso), ("por resolución", medir_resolucion)):
+            antes = medir(f_np, df_np, x0)
+            despues = medir(problema.f, problema.df, x0)
+            print("{:<12} {:<22} {:<16.3f} {:<16.3f} {:<10}".format(
+                nombre, medicion, antes, despues, f"{antes / despues:.1f}x"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Consultas al sustituto precalculado vs resolver cada consulta.
+
+Construye el sustituto de x^3 - exp(0.8x) - c para c en [0, 80], consulta
+c al azar (de a uno, como llegan en línea) y compara el tiempo por consulta
+con Newton desde la raíz de ejer1 y con `barrer` (continuación). Comprueba
+que el error contra una raíz de referencia no supere la cota informada.
+
+Uso (desde codigo_python/):
+    python -m benchmarks.bench_sustituto
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from raices.barrido import barrer
+from raices.metodos import iterar_newton, resultado_final
+from raices.sustituto import construir, familia_exponencial
+
+CONSULTAS = 20_000
+RANGO = (0.0, 80.0)
+
+
+def _por_consulta(funcion, parametros):
+    t0 = time.perf_counter()
+    salida = [funcion(c) for c in parametros]
+    return salida, (time.perf_counter() - t0) / len(parametros) * 1e6
+
+
+def main():
+    t0 = time.perf_counter()
+    sustituto = construir(familia_exponencial, *RANGO, 1.5)
+    print(f"construcción: {time.perf_counter() - t0:.2f} s, {len(sustituto)} tramos")
+
+    parametros = np.random.default_rng(0).uniform(*RANGO, CONSULTAS).tolist()
+    referencia = barrer(familia_exponencial, parametros, 1.5, "newton", 1e-14).raiz
+
+    def newton(c):
+        return resultado_final(
+            iterar_newton(lambda x: familia_exponencial(x, c), None, 3.5, registrar=False)
+        ).raiz
+
+    print("{:<22} {:<14} {:<14} {}".format("", "µs/consulta", "máx |error|", "error <= cota"))
+    todo_bien = True
+    for nombre, pulir in (("sustituto", False), ("sustituto + pulido", True)):
+        consultas, tiempo = _por_consulta(lambda c: sustituto.consultar(c, pulir), parametros)
+        error = np.abs(np.array([q.raiz for q in consultas]) - referencia)
+        ok = bool((error <= np.array([q.cota for q in consultas])).all())
+        todo_bien &= ok
+        print("{:<22} {:<14.2f} {:<14.2e} {}".format(nombre, tiempo, error.max(), "sí" if ok else "NO"))
+
+    for nombre, resolver in (
+        ("newton (x0 = 3.5)", newton),
+        ("barrer (un c)", lambda c: barrer(familia_exponencial, [c], 3.5).raiz[0]),
+    ):
+        raices, tiempo = _por_consulta(resolver, parametros)
+        error = np.abs(np.array(raices) - referencia)
+        print("{:<22} {:<14.2f} {:<14.2e} -".format(nombre, tiempo, error.max()))
+
+    return 0 if todo_bien else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
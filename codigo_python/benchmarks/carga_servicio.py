@@ -0,0 +1,136 @@
+"""Generador de carga para `raices.servicio`.
+
+Abre varios clientes concurrentes; cada uno envía solicitudes de a una y
+espera la respuesta antes de enviar la siguiente (como un manejador de
+peticiones que resuelve una ecuación por vez). Informa el rendimiento, la
+latencia y cuántas respuestas no coinciden con la versión escalar: cada
+solicitud se resuelve también con `raices.metodos` y la raíz del servicio
+debe quedar a menos de tol de la escalar, con el mismo estado.
+
+Uso (desde codigo_python/):
+    python -m benchmarks.carga_servicio                       # servicio propio, en este proceso
+    python -m benchmarks.carga_servicio --unix /tmp/raices.sock --clientes 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from raices.convenciones import TOL
+from raices.expresiones import compilar
+from raices.metodos import iterar_biseccion, iterar_newton, iterar_secante, resultado_final
+from raices.servicio import ESPERA, TAM_LOTE, Servicio, servir
+
+# Ecuaciones de los ejercicios con la constante variada (varias familias a la vez)
+PLANTILLAS = [
+    ("x^3 - exp(0.8*x) - 20", "newton", lambda r: {"x0": r.uniform(3.0, 4.0)}),
+    ("x^3 - 0.5*x^2 + 4*x - 1", "biseccion", lambda r: {"a": r.uniform(-1, 0.2), "b": r.uniform(0.3, 1)}),
+    ("x * cos(x)", "secante", lambda r: {"a": r.uniform(1.4, 1.5), "b": r.uniform(1.6, 1.7)}),
+]
+
+
+def solicitud(r, identificador):
+    ecuacion, metodo, datos = r.choice(PLANTILLAS)
+    return {"id": identificador, "ecuacion": ecuacion, "metodo": metodo, **datos(r)}
+
+
+def escalar(fila):
+    """Resultado de la versión escalar para la misma solicitud."""
+    expresion = compilar(fila["ecuacion"])
+    if fila["metodo"] == "newton":
+        iteraciones = iterar_newton(expresion.f, expresion.df, fila["x0"], registrar=False)
+    elif fila["metodo"] == "secante":
+        iteraciones = iterar_secante(expresion.f, fila["a"], fila["b"], registrar=False)
+    else:
+        iteraciones = iterar_biseccion(expresion.f, fila["a"], fila["b"], registrar=False)
+    return resultado_final(iteraciones)
+
+
+def coincide(fila, respuesta):
+    referencia = escalar(fila)
+    if respuesta["estado"] != referencia.estado:
+        return False
+    if referencia.raiz is None or respuesta["raiz"] is None:
+        return referencia.raiz is None and respuesta["raiz"] is None
+    return abs(respuesta["raiz"] - referencia.raiz) < TOL
+
+
+async def cliente(numero, solicitudes, abrir, latencias, fallidas, respondidas):
+    r = random.Random(numero)
+    lector, escritor = await abrir()
+    for k in range(solicitudes):
+        fila = solicitud(r, f"{numero}-{k}")
+        t0 = time.perf_counter()
+        escritor.write((json.dumps(fila) + "\n").encode())
+        await escritor.drain()
+        respuesta = json.loads(await lector.readline())
+        latencias.append(time.perf_counter() - t0)
+        if respuesta.get("id") != fila["id"] or "error" in respuesta or respuesta["estado"] != 0:
+            fallidas.append(respuesta)
+        else:
+            respondidas.append((fila, respuesta))
+    escritor.close()
+    await escritor.wait_closed()
+
+
+async def generar(args):
+    servidor = None
+    unix = args.unix
+    if unix is None and args.puerto is None:
+        # Sin dirección: se levanta un servicio en este mismo proceso
+        unix = os.path.join(tempfile.mkdtemp(), "raices.sock")
+        servicio = Servicio(args.tam_lote, args.espera_ms / 1000)
+        servidor = asyncio.create_task(servir(servicio, unix=unix))
+        while not os.path.exists(unix):
+            await asyncio.sleep(0.01)
+
+    if unix is not None:
+        abrir = lambda: asyncio.open_unix_connection(unix)
+    else:
+        abrir = lambda: asyncio.open_connection(args.host, args.puerto)
+
+    latencias, fallidas, respondidas = [], [], []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(
+        cliente(i, args.solicitudes, abrir, latencias, fallidas, respondidas) for i in range(args.clientes)
+    ))
+    total = time.perf_counter() - t0
+
+    if servidor is not None:
+        servidor.cancel()
+        print(f"lotes: {servicio.lotes}  tamaño medio: {servicio.solicitudes / servicio.lotes:.1f}")
+
+    latencias = np.array(latencias) * 1000
+    print(f"solicitudes: {latencias.size}  en {total:.2f} s  ({latencias.size / total:.0f}/s)")
+    print("latencia (ms): p50 {:.2f}  p90 {:.2f}  p99 {:.2f}  máx {:.2f}".format(
+        *np.percentile(latencias, [50, 90, 99]), latencias.max()))
+    print(f"respuestas con error o sin converger: {len(fallidas)}")
+    # Fuera de la medición: la versión escalar corre en este mismo proceso
+    distintas = [fila for fila, respuesta in respondidas if not coincide(fila, respuesta)]
+    print(f"respuestas distintas de la versión escalar: {len(distintas)}")
+    return 0 if not fallidas and not distintas else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.carga_servicio",
+                                     description=__doc__.splitlines()[0])
+    parser.add_argument("--unix", help="socket Unix de un servicio ya iniciado")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, help="puerto TCP de un servicio ya iniciado")
+    parser.add_argument("--clientes", type=int, default=100)
+    parser.add_argument("--solicitudes", type=int, default=200, help="solicitudes por cliente")
+    parser.add_argument("--tam-lote", type=int, default=TAM_LOTE, help="(servicio propio)")
+    parser.add_argument("--espera-ms", type=float, default=ESPERA * 1000, help="(servicio propio)")
+    args = parser.parse_args(argv)
+    return asyncio.run(generar(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+"""Benchmark de los métodos sobre los cuatro ejercicios (ejer1.py - ejer4.py).
+
+Para cada ejercicio y método, en modo escalar y por lotes, reporta
+iteraciones, evaluaciones de f, df y d2f (f'', solo Halley), tiempo y
+resoluciones por segundo, y comprueba que las raíces coincidan con las
+salidas de los scripts con la precisión impresa (6 decimales). Termina con
+código 1 si alguna no coincide.
+
+Uso (desde codigo_python/):
+    python -m benchmarks.suite
+    python -m benchmarks.suite --json resultados.json   # para comparar versiones
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from raices import (
+    biseccion,
+    biseccion_lote,
+    brent,
+    halley,
+    medir,
+    newton_lote,
+    newton_raphson,
+    secante,
+    secante_lote,
+    steffensen,
+)
+from raices.convenciones import TOL
+from raices.instrumentacion import instrumentar
+from raices.problemas import EJERCICIOS, SEGUNDAS_DERIVADAS
+
+# Salidas de ejer1.py - ejer4.py: (raíz impresa, iteraciones).
+# Los bloques "Salida del Código" al final de ejer2-4 son de una versión
+# anterior de las funciones y no coinciden con lo que imprimen hoy.
+REFERENCIAS = {
+    (1, "biseccion"): ("3.208191", 14),
+    (1, "newton"): ("3.208220", 3),
+    (1, "secante"): ("3.208220", 4),
+    (2, "biseccion"): ("3.208191", 14),
+    (2, "newton"): ("3.208220", 3),
+    (2, "secante"): ("3.208220", 4),
+    (3, "biseccion"): ("0.253967", 14),
+    (3, "newton"): ("0.253967", 3),
+    (3, "secante"): ("0.253967", 3),
+    (4, "biseccion"): ("1.570740", 13),
+    (4, "newton"): ("1.570796", 3),
+    (4, "secante"): ("1.570796", 4),
+}
+
+
+# --- 1. Métodos: cómo llamar a cada uno con los datos de un ejercicio ---
+# Para agregar un método nuevo basta con agregar sus entradas aquí.
+
+def _argumentos(metodo, ejercicio):
+    if metodo == "newton":
+        return (ejercicio.x0,), ejercicio.problema.df
+    if metodo == "halley":
+        # f' y f'' escritas a mano: con duales cada llamada a f evaluaría las tres
+        return (SEGUNDAS_DERIVADAS[ejercicio.problema.nombre], ejercicio.x0), ejercicio.problema.df
+    if metodo == "steffensen":
+        return (ejercicio.x0,), None
+    if metodo == "secante":
+        return ejercicio.iniciales_secante, None
+    return ejercicio.intervalo, None
+
+
+ESCALARES = {
+    "biseccion": biseccion,
+    "newton": newton_raphson,
+    "secante": secante,
+    "brent": brent,
+    "halley": halley,
+    "steffensen": steffensen,
+}
+
+LOTES = {
+    "biseccion": biseccion_lote,
+    "newton": newton_lote,
+    "secante": secante_lote,
+}
+
+
+def _mejor_tiempo(funcion, repeticiones):
+    """Menor tiempo de `repeticiones` ejecuciones (lo menos afectado por ruido)."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+
+def _verificar(numero, metodo, raiz, iteraciones, referencia_newton):
+    """Compara con la salida registrada; sin registro, con la raíz de Newton."""
+    if (numero, metodo) in REFERENCIAS:
+        texto, iteraciones_ref = REFERENCIAS[(numero, metodo)]
+        return f"{raiz:.6f}" == texto and iteraciones == iteraciones_ref
+    return abs(raiz - referencia_newton) < TOL
+
+# --- 2. Mediciones ---
+
+def medir_escalar(numero, metodo, repeticiones):
+    ejercicio = EJERCICIOS[numero]
+    f = ejercicio.problema.f
+    args, df = _argumentos(metodo, ejercicio)
+    funcion = ESCALARES[metodo]
+
+    # `medir` cuenta f y df; f'' (primer argumento de Halley) se cuenta aparte
+    d2f = instrumentar(args[0], "d2f") if metodo == "halley" else None
+    argumentos = (d2f,) + args[1:] if d2f is not None else args
+    resultado, costo = medir(funcion, f, *argumentos, TOL, df=df, mostrar=False)
+    if df is None:
+        tiempo = _mejor_tiempo(lambda: funcion(f, *args, TOL, mostrar=False), repeticiones)
+    else:
+        tiempo = _mejor_tiempo(lambda: funcion(f, df, *args, TOL, mostrar=False), repeticiones)
+
+    return {
+        "ejercicio": numero,
+        "metodo": metodo,
+        "modo": "escalar",
+        "raiz": float(resultado.raiz),
+        "iteraciones": resultado.iteraciones,
+        "evaluaciones_f": costo.evaluaciones_f,
+        "evaluaciones_df": costo.evaluaciones_df,
+        "evaluaciones_d2f": d2f.evaluaciones if d2f is not None else 0,
+        "tiempo_s": tiempo,
+        "resoluciones_por_s": 1 / tiempo,
+    }
+
+
+def medir_lote(numero, metodo, carriles, repeticiones):
+    ejercicio = EJERCICIOS[numero]
+    f = ejercicio.problema.f
+    args, df = _argumentos(metodo, ejercicio)
+    args = tuple(np.full(carriles, valor, dtype=float) for valor in args)
+    funcion = LOTES[metodo]
+
+    resultado, costo = medir(funcion, f, *args, TOL, df=df)
+    if df is None:
+        tiempo = _mejor_tiempo(lambda: funcion(f, *args, TOL), repeticiones)
+    else:
+        tiempo = _mejor_tiempo(lambda: funcion(f, df, *args, TOL), repeticiones)
+
+    return {
+        "ejercicio": numero,
+        "metodo": metodo,
+        "modo": "lote",
+        "carriles": carriles,
+        "raiz": float(resultado.raiz[0]),
+        "iteraciones": int(resultado.iteraciones[0]),
+        "evaluaciones_f": costo.evaluaciones_f / carriles,
+        "evaluaciones_df": costo.evaluaciones_df / carriles,
+        "evaluaciones_d2f": 0,
+        "tiempo_s": tiempo,
+        "resoluciones_por_s": carriles / tiempo,
+    }
+
+
+def ejecutar(carriles=100000, repeticiones=20):
+    registros = []
+    for numero in sorted(EJERCICIOS):
+        medidos = [medir_escalar(numero, metodo, repeticiones) for metodo in ESCALARES]
+        medidos += [medir_lote(numero, metodo, carriles, max(repeticiones // 10, 1))
+                    for metodo in LOTES]
+
+        referencia_newton = next(r["raiz"] for r in medidos if r["metodo"] == "newton")
+        for registro in medidos:
+            registro["coincide"] = _verificar(
+                numero, registro["metodo"], registro["raiz"], registro["iteraciones"],
+                referencia_newton,
+            )
+        registros += medidos
+    return registros
+
+
+def imprimir(registros):
+    print("{:<4} {:<10} {:<8} {:<10} {:<6} {:<8} {:<8} {:<8} {:<12} {:<14} {}".format(
+        "ej", "método", "modo", "raíz", "iter", "f", "df", "d2f", "tiempo (us)", "resol./s", "ok"))
+    for r in registros:
+        print("{:<4} {:<10} {:<8} {:<10.6f} {:<6} {:<8g} {:<8g} {:<8g} {:<12.2f} {:<14.0f} {}".format(
+            r["ejercicio"], r["metodo"], r["modo"], r["raiz"], r["iteraciones"],
+            r["evaluaciones_f"], r["evaluaciones_df"], r["evaluaciones_d2f"], r["tiempo_s"] * 1e6,
+            r["resoluciones_por_s"], "sí" if r["coincide"] else "NO"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="guardar los resultados en este archivo JSON")
+    parser.add_argument("--carriles", type=int, default=100000, help="problemas por lote")
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    registros = ejecutar(args.carriles, args.repeticiones)
+    imprimir(registros)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as archivo:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "plataforma": platform.platform(),
+                "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "registros": registros,
+            }, archivo, indent=2, ensure_ascii=False)
+
+    return 0 if all(r["coincide"] for r in registros) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
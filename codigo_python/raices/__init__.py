@@ -0,0 +1,83 @@
+"""Raíces de ecuaciones: métodos de Bisección, Newton-Raphson, Secante, Brent y otros.
+
+Importar el paquete no ejecuta ningún cálculo ni importa NumPy: los métodos
+por lotes (que sí lo necesitan) se cargan la primera vez que se usan.
+"""
+
+from importlib import import_module
+
+from .cache import FuncionMemorizada, cache_problema, estadisticas, limpiar_caches, memorizar
+from .convenciones import (
+    CONVERGIDO,
+    DIVISION_CERO,
+    MAX_ITER,
+    MAX_ITERACIONES,
+    RAIZ_EXACTA,
+    SIN_CAMBIO_SIGNO,
+    TOL,
+)
+from .dual import Dual, derivada, valor_y_derivada, valor_y_derivadas
+from .instrumentacion import Costo, FuncionInstrumentada, instrumentar, medir
+from .metodos import (
+    Iteracion,
+    Resultado,
+    aitken,
+    biseccion,
+    brent,
+    convergencia,
+    halley,
+    imprimir_tabla,
+    iterar_aitken,
+    iterar_biseccion,
+    iterar_brent,
+    iterar_halley,
+    iterar_newton,
+    iterar_newton_modificado,
+    iterar_secante,
+    iterar_steffensen,
+    multiplicidad,
+    newton_modificado,
+    newton_raphson,
+    orden_observado,
+    resultado_final,
+    secante,
+    steffensen,
+)
+from .problemas import EJERCICIOS, PROBLEMAS, Problema
+from .seleccion import resolver, solve
+
+# Nombres que dependen de NumPy -> módulo donde se definen
+_PEREZOSOS = {
+    "ResultadoLote": "lote",
+    "ResultadoNewtonLote": "lote",
+    "biseccion_lote": "lote",
+    "newton_lote": "lote",
+    "secante_lote": "lote",
+    "biseccion_mixta": "mixta",
+    "newton_mixta": "mixta",
+    "secante_mixta": "mixta",
+    "buscar_intervalos": "busqueda",
+    "buscar_raices": "busqueda",
+    "find_all_roots": "busqueda",
+    "Expresion": "expresiones",
+    "compilar": "expresiones",
+    "ResultadoBarrido": "barrido",
+    "barrer": "barrido",
+    "Cuencas": "cuencas",
+    "abrir_cuencas": "cuencas",
+    "mapa_cuencas": "cuencas",
+    "Consulta": "sustituto",
+    "Sustituto": "sustituto",
+}
+
+
+def __getattr__(nombre):
+    if nombre in _PEREZOSOS:
+        valor = getattr(import_module(f".{_PEREZOSOS[nombre]}", __name__), nombre)
+        globals()[nombre] = valor
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_PEREZOSOS))
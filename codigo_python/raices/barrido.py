@@ -0,0 +1,160 @@
+"""Barridos de parámetro con continuación: resolver f(x, c) = 0 para muchos c.
+
+En familias como x^3 - exp(0.8x) - c (ejer1/ejer2 con c en lugar de 20),
+las raíces de valores de c cercanos están cerca. En vez de arrancar cada
+resolución desde el mismo x0, los valores de c se ordenan y cada una parte
+de una predicción hecha con la raíz anterior:
+
+    x_pred = x_ant + dx/dc * (c - c_ant),   dx/dc = -f_c / f_x
+
+Con Newton, f_x y f_c se obtienen por diferenciación automática (f debe
+aceptar números duales, como las de los ejercicios). Con la secante, dx/dc
+se aproxima con las dos raíces anteriores, sin derivadas. Así la mayoría de
+las resoluciones terminan en una o dos iteraciones.
+
+Si la continuación falla (no converge o sale del intervalo), se recurre a
+Brent sobre `intervalo` o, si no se dio, sobre un intervalo con cambio de
+signo buscado alrededor de la raíz anterior. Si Brent tampoco encuentra una
+raíz, el punto queda con raíz nan y un estado de falla, y la predicción del
+siguiente parte de la última raíz aceptada.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from .convenciones import (
+    CONVERGIDO,
+    EPS_DIVISION,
+    MAX_ITER,
+    RAIZ_EXACTA,
+    SIN_CAMBIO_SIGNO,
+    TOL,
+)
+from .dual import valor_y_derivada
+from .metodos import (
+    _segundo_inicial,
+    iterar_brent,
+    iterar_newton,
+    iterar_secante,
+    resultado_final,
+)
+
+# respaldo: True donde la continuación falló y se usó Brent
+ResultadoBarrido = namedtuple(
+    "ResultadoBarrido", ["parametros", "raiz", "iteraciones", "estado", "respaldo"]
+)
+
+METODOS = ("newton", "secante")
+
+# --- 1. Predicción ---
+
+def sensibilidad(f, x, c):
+    """dx/dc sobre la curva f(x, c) = 0, en un punto (x, c) de la curva."""
+    _, f_x = valor_y_derivada(lambda x: f(x, c), x)
+    _, f_c = valor_y_derivada(lambda c: f(x, c), c)
+    if abs(f_x) < EPS_DIVISION:
+        return 0.0
+    return -f_c / f_x
+
+
+# --- 2. Resolución de un punto ---
+
+def _continuar(g, metodo, x_ant, x_pred, tol):
+    if metodo == "newton":
+        return resultado_final(iterar_newton(g, None, x_pred, tol, registrar=False))
+    if x_pred == x_ant:
+        x_ant = _segundo_inicial(x_pred)
+    return resultado_final(iterar_secante(g, x_ant, x_pred, tol, registrar=False))
+
+
+def _acotar(g, x, ancho):
+    """Busca [a, b] con cambio de signo alrededor de x, duplicando el ancho."""
+    gx = g(x)
+    for _ in range(MAX_ITER):
+        if gx * g(x + ancho) <= 0:
+            return x, x + ancho
+        if gx * g(x - ancho) <= 0:
+            return x - ancho, x
+        ancho *= 2
+    return None
+
+
+def _aceptable(resultado, intervalo):
+    if resultado.estado not in (CONVERGIDO, RAIZ_EXACTA) or not math.isfinite(resultado.raiz):
+        return False
+    return intervalo is None or min(intervalo) <= resultado.raiz <= max(intervalo)
+
+
+def _estado_fallido(resultado):
+    # Una raíz convergida pero fuera del intervalo cuenta como sin cambio de signo
+    if resultado.estado in (CONVERGIDO, RAIZ_EXACTA):
+        return SIN_CAMBIO_SIGNO
+    return resultado.estado
+
+
+def _respaldo(g, x, ancho, intervalo, tol):
+    acotado = intervalo if intervalo is not None else _acotar(g, x, ancho)
+    if acotado is None:
+        return None
+    return resultado_final(iterar_brent(g, *acotado, tol, registrar=False))
+
+# --- 3. Barrido ---
+
+def barrer(f, parametros, x0, metodo="newton", tol=TOL, intervalo=None):
+    """Resuelve f(x, c) = 0 para cada c de `parametros` con arranque en caliente.
+
+    `x0` es el valor inicial del primer c (el menor). Devuelve un
+    `ResultadoBarrido` con arreglos en el orden de `parametros`.
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método desconocido {metodo!r}; use uno de {METODOS}.")
+
+    parametros = np.asarray(parametros, dtype=float)
+    n = parametros.size
+    raiz = np.full(n, np.nan)
+    iteraciones = np.zeros(n, dtype=np.int64)
+    estado = np.zeros(n, dtype=np.int8)
+    respaldo = np.zeros(n, dtype=bool)
+
+    anteriores = []  # (c, x) de las últimas raíces aceptadas
+    for i in np.argsort(parametros, kind="stable"):
+        c = float(parametros[i])
+
+        def g(x):
+            return f(x, c)
+
+        if not anteriores:
+            x_ant = x_pred = float(x0)
+        else:
+            c_ant, x_ant = anteriores[-1]
+            if metodo == "newton":
+                pendiente = sensibilidad(f, x_ant, c_ant)
+            elif len(anteriores) == 2 and anteriores[0][0] != c_ant:
+                pendiente = (x_ant - anteriores[0][1]) / (c_ant - anteriores[0][0])
+            else:
+                pendiente = 0.0
+            x_pred = x_ant + pendiente * (c - c_ant)
+
+        resultado = _continuar(g, metodo, x_ant, x_pred, tol)
+        if not _aceptable(resultado, intervalo):
+            ancho = max(abs(x_pred - x_ant), abs(x_ant) * 1e-2, tol)
+            refugio = _respaldo(g, x_ant, ancho, intervalo, tol)
+            if refugio is not None and _aceptable(refugio, None):
+                resultado = refugio
+                respaldo[i] = True
+            else:
+                # Ni la continuación ni Brent dieron una raíz válida: el punto
+                # queda sin raíz y no se usa para predecir los siguientes
+                fallido = resultado if refugio is None else refugio
+                iteraciones[i] = fallido.iteraciones
+                estado[i] = _estado_fallido(fallido)
+                continue
+
+        raiz[i] = resultado.raiz
+        iteraciones[i] = resultado.iteraciones
+        estado[i] = resultado.estado
+        anteriores = (anteriores + [(c, float(resultado.raiz))])[-2:]
+
+    return ResultadoBarrido(parametros, raiz, iteraciones, estado, respaldo)
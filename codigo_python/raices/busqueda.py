@@ -0,0 +1,76 @@
+"""Búsqueda automática de todas las raíces reales en un intervalo.
+
+Se evalúa `f` sobre una malla densa (por bloques, para acotar la memoria),
+se detectan todos los cambios de signo y los intervalos resultantes se
+refinan de una sola vez con un método vectorizado.
+"""
+
+import numpy as np
+
+from .convenciones import MAX_ITER, RAIZ_EXACTA, TOL
+from .lote import ResultadoLote, biseccion_lote
+
+# Puntos de la malla evaluados por bloque
+TAM_BLOQUE = 65536
+
+
+def buscar_intervalos(f, lo, hi, n=10000, tam_bloque=TAM_BLOQUE):
+    """Devuelve (a, b, ceros): intervalos con cambio de signo y ceros exactos de la malla.
+
+    La malla tiene n subintervalos iguales en [lo, hi]. Raíces separadas por
+    menos de (hi - lo) / n, o de multiplicidad par, pueden no detectarse.
+    """
+    if not hi > lo:
+        raise ValueError(f"Se requiere lo < hi (recibido [{lo}, {hi}]).")
+    if n < 1:
+        raise ValueError("La malla necesita al menos un subintervalo.")
+
+    ancho = (hi - lo) / n
+    izquierdos, derechos, ceros = [], [], []
+
+    for inicio in range(0, n, tam_bloque):
+        fin = min(inicio + tam_bloque, n)
+        # Cada bloque incluye el primer punto del siguiente para no perder cambios
+        x = lo + ancho * np.arange(inicio, fin + 1)
+        if fin == n:
+            x[-1] = hi  # Evitar el error de redondeo en el extremo
+        fx = f(x)
+
+        cambio = np.flatnonzero(fx[:-1] * fx[1:] < 0)
+        izquierdos.append(x[cambio])
+        derechos.append(x[cambio + 1])
+
+        # Los ceros se cuentan en el punto izquierdo de cada subintervalo
+        ceros.append(x[:-1][fx[:-1] == 0])
+        if fin == n and fx[-1] == 0:
+            ceros.append(x[-1:])
+
+    return np.concatenate(izquierdos), np.concatenate(derechos), np.concatenate(ceros)
+
+
+def buscar_raices(f, lo, hi, n=10000, tol=TOL, max_iter=MAX_ITER,
+                  metodo=biseccion_lote, tam_bloque=TAM_BLOQUE):
+    """Encuentra todas las raíces reales de `f` en [lo, hi].
+
+    `f` debe aceptar arreglos de NumPy. `metodo` es el método vectorizado de
+    refinamiento, con la firma de `biseccion_lote`. Devuelve un
+    `ResultadoLote` ordenado por raíz; los ceros exactos de la malla se
+    reportan con 0 iteraciones y estado RAIZ_EXACTA.
+    """
+    a, b, ceros = buscar_intervalos(f, lo, hi, n, tam_bloque)
+    refinado = metodo(f, a, b, tol, max_iter)
+
+    raiz = np.concatenate([refinado.raiz, ceros])
+    iteraciones = np.concatenate(
+        [refinado.iteraciones, np.zeros(ceros.size, dtype=refinado.iteraciones.dtype)]
+    )
+    estado = np.concatenate(
+        [refinado.estado, np.full(ceros.size, RAIZ_EXACTA, dtype=refinado.estado.dtype)]
+    )
+
+    orden = np.argsort(raiz, kind="stable")
+    return ResultadoLote(raiz[orden], iteraciones[orden], estado[orden])
+
+
+# Alias en inglés
+find_all_roots = buscar_raices
@@ -0,0 +1,112 @@
+"""Cache de evaluaciones de f y df por problema, compartida entre métodos y corridas.
+
+Los tres métodos de un ejercicio evalúan muchas veces los mismos puntos: los
+extremos del intervalo [3.0, 4.0], su punto medio 3.5 (que también es el x0
+de Newton), y los ejercicios 1 y 2 resuelven el mismo problema. Con una `f`
+cara (una simulación) cada repetición cuesta lo mismo que la primera.
+
+`memorizar(f)` devuelve una función que recuerda los últimos `tam` valores
+(LRU) y cuenta aciertos y fallos. `cache_problema(problema)` devuelve el
+problema con f y df memorizadas, siempre las mismas para el mismo problema,
+así que la cache se comparte entre métodos y entre corridas del proceso.
+
+Solo se memorizan números (float e int); los arreglos y los números duales
+pasan directo a la función. La clave incluye el tipo: f(0) y f(0.0) pueden
+dar resultados de distinto tipo y se guardan por separado.
+"""
+
+from collections import OrderedDict, namedtuple
+
+from .problemas import Problema
+
+# Valores guardados por función
+TAM_CACHE = 4096
+
+EstadisticasCache = namedtuple("EstadisticasCache", ["aciertos", "fallos", "tam", "ocupados"])
+
+_NUMEROS = (float, int)
+
+
+class FuncionMemorizada:
+    """Envuelve una función de un número con una cache LRU de `tam` valores."""
+
+    __slots__ = ("funcion", "tam", "aciertos", "fallos", "_valores")
+
+    def __init__(self, funcion, tam=TAM_CACHE):
+        self.funcion = funcion
+        self.tam = tam
+        self._valores = OrderedDict()
+        self.limpiar()
+
+    def limpiar(self):
+        self._valores.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def info(self):
+        return EstadisticasCache(self.aciertos, self.fallos, self.tam, len(self._valores))
+
+    def __call__(self, x):
+        if not isinstance(x, _NUMEROS):
+            return self.funcion(x)
+
+        clave = (type(x), x)
+        try:
+            y = self._valores[clave]
+        except KeyError:
+            pass
+        else:
+            self._valores.move_to_end(clave)
+            self.aciertos += 1
+            return y
+
+        # Si la función lanza una excepción no se guarda nada
+        y = self.funcion(x)
+        self.fallos += 1
+        self._valores[clave] = y
+        if len(self._valores) > self.tam:
+            self._valores.popitem(last=False)
+        return y
+
+
+def memorizar(funcion, tam=TAM_CACHE, activo=True):
+    """Devuelve `funcion` con cache, o la misma función si activo=False."""
+    if not activo or funcion is None or isinstance(funcion, FuncionMemorizada):
+        return funcion
+    return FuncionMemorizada(funcion, tam)
+
+# --- Caches por problema ---
+
+_PROBLEMAS = {}
+
+
+def cache_problema(problema, tam=TAM_CACHE):
+    """El `Problema` con f y df memorizadas (el mismo objeto en cada llamada)."""
+    memorizado = _PROBLEMAS.get(problema)
+    if memorizado is None:
+        memorizado = Problema(
+            problema.nombre, problema.expresion,
+            memorizar(problema.f, tam), memorizar(problema.df, tam),
+        )
+        _PROBLEMAS[problema] = memorizado
+    return memorizado
+
+
+def estadisticas(problema):
+    """{"f": EstadisticasCache, "df": EstadisticasCache} de la cache del problema."""
+    memorizado = _PROBLEMAS.get(problema)
+    if memorizado is None:
+        return {}
+    return {
+        nombre: funcion.info()
+        for nombre, funcion in (("f", memorizado.f), ("df", memorizado.df))
+        if isinstance(funcion, FuncionMemorizada)
+    }
+
+
+def limpiar_caches():
+    """Vacía las caches de todos los problemas."""
+    for memorizado in _PROBLEMAS.values():
+        for funcion in (memorizado.f, memorizado.df):
+            if isinstance(funcion, FuncionMemorizada):
+                funcion.limpiar()
@@ -0,0 +1,67 @@
+"""Línea de comandos: reproduce los ejercicios ejer1.py - ejer4.py.
+
+Uso (desde codigo_python/):
+    python -m raices            # los cuatro ejercicios
+    python -m raices 3 4        # solo los ejercicios 3 y 4
+    python -m raices 1 --tol 1e-8
+"""
+
+import argparse
+
+from .cache import cache_problema
+from .convenciones import TOL
+from .metodos import imprimir_tabla, iterar_biseccion, iterar_newton, iterar_secante
+from .problemas import EJERCICIOS
+
+# Títulos de ejer1/ejer2, que numeran la raíz buscada
+_TITULOS_RAIZ = {
+    "biseccion": "--- Bisección (Raíz {}) ---",
+    "newton": "--- Newton-Raphson (Raíz {}) ---",
+    "secante": "--- Método de la Secante (Raíz {}) ---",
+}
+
+
+def ejecutar_ejercicio(numero, tol=TOL, cache=True):
+    """Imprime la salida del ejercicio `numero` con los tres métodos.
+
+    Con cache=True los métodos comparten las evaluaciones de f y df del
+    problema (también con otros ejercicios del mismo problema).
+    """
+    ejercicio = EJERCICIOS[numero]
+    problema = cache_problema(ejercicio.problema) if cache else ejercicio.problema
+    f, df = problema.f, problema.df
+
+    def titulo(metodo):
+        if ejercicio.raiz_id is None:
+            return None
+        return _TITULOS_RAIZ[metodo].format(ejercicio.raiz_id)
+
+    print(ejercicio.encabezado)
+    a, b = ejercicio.intervalo
+    print(imprimir_tabla(iterar_biseccion(f, a, b, tol), "biseccion", titulo("biseccion")))
+    print(imprimir_tabla(iterar_newton(f, df, ejercicio.x0, tol), "newton", titulo("newton")))
+    x_menos_1, x0 = ejercicio.iniciales_secante
+    print(imprimir_tabla(iterar_secante(f, x_menos_1, x0, tol), "secante", titulo("secante")))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="raices",
+        description="Raíces de ecuaciones: Bisección, Newton-Raphson y Secante.",
+    )
+    parser.add_argument(
+        "ejercicios", nargs="*", type=int,
+        help="ejercicios a ejecutar, del 1 al 4 (por defecto, todos)",
+    )
+    parser.add_argument("--tol", type=float, default=TOL, help=f"tolerancia (por defecto {TOL})")
+    parser.add_argument("--sin-cache", action="store_true",
+                        help="no compartir evaluaciones de f y df entre métodos")
+    args = parser.parse_args(argv)
+
+    invalidos = [n for n in args.ejercicios if n not in EJERCICIOS]
+    if invalidos:
+        parser.error(f"ejercicio inexistente: {invalidos[0]} (elija entre 1 y 4)")
+
+    for numero in args.ejercicios or sorted(EJERCICIOS):
+        ejecutar_ejercicio(numero, args.tol, not args.sin_cache)
+    return 0
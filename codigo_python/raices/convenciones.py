@@ -0,0 +1,26 @@
+"""Convenciones compartidas por todos los métodos: tolerancia, límites y estados."""
+
+# Tolerancia de error absoluto (la misma de los ejercicios)
+TOL = 0.0001
+
+# Límite de iteraciones
+MAX_ITER = 50
+
+# Umbral para evitar división por cero (derivada o denominador nulo)
+EPS_DIVISION = 1e-10
+
+# --- Códigos de estado de los resultados ---
+
+CONVERGIDO = 0          # Se cumplió el criterio de parada
+RAIZ_EXACTA = 1         # f(p) == 0 exactamente
+SIN_CAMBIO_SIGNO = 2    # El intervalo no encierra la raíz
+MAX_ITERACIONES = 3     # Convergencia lenta: se agotó el límite de iteraciones
+DIVISION_CERO = 4       # Derivada o denominador cercano a cero
+
+DESCRIPCION_ESTADO = {
+    CONVERGIDO: "Raíz encontrada",
+    RAIZ_EXACTA: "Raíz exacta",
+    SIN_CAMBIO_SIGNO: "El intervalo no encierra la raíz (no hay cambio de signo)",
+    MAX_ITERACIONES: "Convergencia lenta",
+    DIVISION_CERO: "División por cero",
+}
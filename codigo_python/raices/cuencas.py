@@ -0,0 +1,237 @@
+"""Cuencas de atracción de Newton en el plano complejo, por bloques y en disco.
+
+Para cada punto z0 de una grilla compleja se itera Newton sobre el polinomio
+(en complejos) y se anota a cuál de sus raíces converge y en cuántas
+iteraciones. Así se eligen valores iniciales robustos para cúbicas como la
+de ejer3. La grilla (decenas de millones de puntos) se procesa en bloques de
+filas de tamaño fijo y los resultados se escriben en arreglos .npy mapeados
+en memoria, en un directorio:
+
+- indice.npy:       int8 (alto, ancho), número de raíz (en el orden de
+                    `polinomios.raices`) o -1 si no convergió
+- iteraciones.npy:  int16 (alto, ancho)
+- completados.npy:  bool, un valor por bloque ya escrito
+- parametros.json:  polinomio, región, resolución, tol y tamaño de bloque
+
+Si el cálculo se interrumpe, volver a llamar con los mismos parámetros
+retoma desde los bloques que faltan. Los bloques se pueden repartir entre
+procesos: cada uno abre los mismos archivos y escribe solo sus filas.
+
+Uso (desde codigo_python/):
+    python -m raices.cuencas cuencas/ --coef 1 -0.5 4 -1 --resolucion 4000 4000 --procesos 8
+"""
+
+import argparse
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .convenciones import MAX_ITER, TOL
+from .polinomios import horner, raices
+
+Cuencas = namedtuple("Cuencas", ["raices", "indice", "iteraciones", "parametros"])
+
+# Puntos por bloque (se redondea a filas enteras)
+TAM_BLOQUE = 1 << 20
+
+# Distancia máxima (en múltiplos de tol) del punto final a la raíz para asignarlo
+CLASIFICACION = 10
+
+SIN_RAIZ = -1
+
+# --- 1. Newton complejo por lotes ---
+
+def newton_complejo_lote(coef, z0, raices_p, tol=TOL, max_iter=MAX_ITER):
+    """Newton sobre el polinomio desde cada z0 complejo.
+
+    Devuelve (indice, iteraciones): la raíz de `raices_p` a la que llegó cada
+    punto (-1 si no convergió, la derivada se anuló o terminó lejos de toda
+    raíz) y las iteraciones usadas.
+    """
+    z = np.array(z0, dtype=complex).ravel()
+    raices_p = np.asarray(raices_p, dtype=complex)
+    indice = np.full(z.size, SIN_RAIZ, dtype=np.int8)
+    iteraciones = np.zeros(z.size, dtype=np.int16)
+    activos = np.arange(z.size)
+
+    with np.errstate(all="ignore"):
+        for i in range(max_iter):
+            if activos.size == 0:
+                break
+            z_k = z[activos]
+            p, dp = horner(coef, z_k)
+            paso = p / dp
+            z_k = z_k - paso
+            z[activos] = z_k
+            iteraciones[activos] = i + 1
+
+            # f' nula o desborde: el punto queda sin raíz
+            finito = np.isfinite(z_k)
+            convergido = finito & (np.abs(paso) < tol)
+            if convergido.any():
+                distancias = np.abs(z_k[convergido, None] - raices_p[None, :])
+                cercana = np.argmin(distancias, axis=1)
+                asignable = distancias[np.arange(cercana.size), cercana] < CLASIFICACION * tol
+                indice[activos[convergido][asignable]] = cercana[asignable]
+            activos = activos[finito & ~convergido]
+
+    forma = np.shape(z0)
+    return indice.reshape(forma), iteraciones.reshape(forma)
+
+# --- 2. Archivos y bloques ---
+
+def _parametros(coef, region, resolucion, tol, max_iter, tam_bloque):
+    ancho, alto = resolucion
+    return {
+        "coef": [float(c) for c in coef],
+        "region": [float(v) for v in region],
+        "resolucion": [int(ancho), int(alto)],
+        "tol": float(tol),
+        "max_iter": int(max_iter),
+        "filas_por_bloque": max(1, int(tam_bloque) // int(ancho)),
+    }
+
+
+def _ruta(directorio, nombre):
+    return os.path.join(directorio, nombre)
+
+
+def _preparar_directorio(directorio, parametros):
+    """Crea los archivos, o comprueba que los existentes sean de los mismos parámetros."""
+    ruta_parametros = _ruta(directorio, "parametros.json")
+    ancho, alto = parametros["resolucion"]
+    bloques = -(-alto // parametros["filas_por_bloque"])
+
+    if os.path.exists(ruta_parametros):
+        with open(ruta_parametros, encoding="utf-8") as archivo:
+            anteriores = json.load(archivo)
+        if anteriores != parametros:
+            raise ValueError(
+                f"{directorio!r} tiene un mapa con otros parámetros; use otro directorio."
+            )
+        return
+
+    os.makedirs(directorio, exist_ok=True)
+    for nombre, dtype, forma in (
+        ("indice.npy", np.int8, (alto, ancho)),
+        ("iteraciones.npy", np.int16, (alto, ancho)),
+        ("completados.npy", bool, (bloques,)),
+    ):
+        # Solo crea el archivo (a ceros); los bloques lo llenan después
+        arreglo = np.lib.format.open_memmap(_ruta(directorio, nombre), "w+", dtype, forma)
+        arreglo.flush()
+        del arreglo
+    # parametros.json se escribe al final: marca que los archivos están completos
+    with open(ruta_parametros, "w", encoding="utf-8") as archivo:
+        json.dump(parametros, archivo)
+
+
+def _grilla(parametros, fila0, fila1):
+    """Puntos complejos (centros de píxel) de las filas [fila0, fila1)."""
+    re_min, re_max, im_min, im_max = parametros["region"]
+    ancho, alto = parametros["resolucion"]
+    re = re_min + (np.arange(ancho) + 0.5) * (re_max - re_min) / ancho
+    im = im_max - (np.arange(fila0, fila1) + 0.5) * (im_max - im_min) / alto
+    return re[None, :] + 1j * im[:, None]
+
+
+def _resolver_bloque(directorio, parametros, raices_p, bloque):
+    """Calcula las filas de un bloque y las escribe en los archivos mapeados."""
+    filas = parametros["filas_por_bloque"]
+    fila0 = bloque * filas
+    fila1 = min(fila0 + filas, parametros["resolucion"][1])
+
+    indice, iteraciones = newton_complejo_lote(
+        parametros["coef"], _grilla(parametros, fila0, fila1), raices_p,
+        parametros["tol"], parametros["max_iter"],
+    )
+    for nombre, valores in (("indice.npy", indice), ("iteraciones.npy", iteraciones)):
+        salida = np.load(_ruta(directorio, nombre), mmap_mode="r+")
+        salida[fila0:fila1] = valores
+        salida.flush()
+        del salida
+    return bloque
+
+# --- 3. Mapa completo ---
+
+def mapa_cuencas(coef, directorio, region=(-2.0, 2.0, -2.0, 2.0), resolucion=(1000, 1000),
+                 tol=TOL, max_iter=MAX_ITER, procesos=1, tam_bloque=TAM_BLOQUE):
+    """Calcula (o termina de calcular) el mapa de cuencas del polinomio en `directorio`.
+
+    region = (re_min, re_max, im_min, im_max); resolucion = (ancho, alto) en
+    puntos. Con procesos > 1 los bloques se reparten entre procesos. Devuelve
+    el mapa abierto con `abrir_cuencas`.
+    """
+    parametros = _parametros(coef, region, resolucion, tol, max_iter, tam_bloque)
+    _preparar_directorio(directorio, parametros)
+    raices_p = raices(parametros["coef"])
+
+    completados = np.load(_ruta(directorio, "completados.npy"), mmap_mode="r+")
+    pendientes = np.flatnonzero(~completados).tolist()
+
+    def marcar(bloque):
+        # Solo después de que las filas del bloque están en disco
+        completados[bloque] = True
+        completados.flush()
+
+    if procesos == 1:
+        for bloque in pendientes:
+            marcar(_resolver_bloque(directorio, parametros, raices_p, bloque))
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            futuros = [
+                ejecutor.submit(_resolver_bloque, directorio, parametros, raices_p, bloque)
+                for bloque in pendientes
+            ]
+            for futuro in futuros:
+                marcar(futuro.result())
+    del completados
+
+    return abrir_cuencas(directorio)
+
+
+def abrir_cuencas(directorio):
+    """Abre un mapa ya calculado (arreglos mapeados de solo lectura)."""
+    with open(_ruta(directorio, "parametros.json"), encoding="utf-8") as archivo:
+        parametros = json.load(archivo)
+    return Cuencas(
+        raices(parametros["coef"]),
+        np.load(_ruta(directorio, "indice.npy"), mmap_mode="r"),
+        np.load(_ruta(directorio, "iteraciones.npy"), mmap_mode="r"),
+        parametros,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m raices.cuencas",
+        description="Mapa de cuencas de atracción de Newton de un polinomio.",
+    )
+    parser.add_argument("directorio", help="directorio de salida (se retoma si ya existe)")
+    parser.add_argument("--coef", type=float, nargs="+", default=[1, -0.5, 4, -1],
+                        help="coeficientes, del grado mayor al término independiente "
+                             "(por defecto la cúbica de ejer3)")
+    parser.add_argument("--region", type=float, nargs=4, default=[-2.0, 2.0, -2.0, 2.0],
+                        metavar=("RE_MIN", "RE_MAX", "IM_MIN", "IM_MAX"))
+    parser.add_argument("--resolucion", type=int, nargs=2, default=[1000, 1000],
+                        metavar=("ANCHO", "ALTO"))
+    parser.add_argument("--tol", type=float, default=TOL)
+    parser.add_argument("--procesos", type=int, default=1)
+    parser.add_argument("--tam-bloque", type=int, default=TAM_BLOQUE,
+                        help=f"puntos por bloque (por defecto {TAM_BLOQUE})")
+    args = parser.parse_args(argv)
+
+    cuencas = mapa_cuencas(args.coef, args.directorio, args.region, args.resolucion,
+                           args.tol, MAX_ITER, args.procesos, args.tam_bloque)
+    conteo = np.bincount(np.asarray(cuencas.indice).ravel() + 1, minlength=len(cuencas.raices) + 1)
+    print(f"sin converger: {conteo[0]}")
+    for i, raiz in enumerate(cuencas.raices):
+        print(f"raíz {i} ({raiz:.6f}): {conteo[i + 1]} puntos")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
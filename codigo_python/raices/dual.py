@@ -0,0 +1,244 @@
+"""Diferenciación automática hacia adelante con números duales.
+
+Un número dual `Dual(v, d)` lleva el valor v y la derivada d. Al evaluar
+f(Dual(x, 1)) se obtienen f(x) y f'(x) en una sola pasada, reutilizando las
+subexpresiones comunes (exp(0.8x) se calcula una sola vez para f y f').
+
+Funciona con escalares y con arreglos de NumPy (v y d pueden ser arreglos), y
+también con funciones escritas con `np.exp`, `np.cos`, etc. como las de los
+ejercicios: NumPy le delega esas operaciones a `Dual.__array_ufunc__`.
+"""
+
+import math
+import operator
+
+_NUMEROS = (float, int)
+
+
+def _np():
+    import numpy
+    return numpy
+
+
+class Dual:
+    __slots__ = ("valor", "derivada")
+
+    def __init__(self, valor, derivada=0.0):
+        self.valor = valor
+        self.derivada = derivada
+
+    def __repr__(self):
+        return f"Dual({self.valor!r}, {self.derivada!r})"
+
+    # --- Aritmética ---
+
+    def __add__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor + otro.valor, self.derivada + otro.derivada)
+        return Dual(self.valor + otro, self.derivada)
+
+    __radd__ = __add__
+
+    def __sub__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(self.valor - otro.valor, self.derivada - otro.derivada)
+        return Dual(self.valor - otro, self.derivada)
+
+    def __rsub__(self, otro):
+        return Dual(otro - self.valor, -self.derivada)
+
+    def __mul__(self, otro):
+        if isinstance(otro, Dual):
+            return Dual(
+                self.valor * otro.valor,
+                self.derivada * otro.valor + self.valor * otro.derivada,
+            )
+        return Dual(self.valor * otro, self.derivada * otro)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, otro):
+        if isinstance(otro, Dual):
+            cociente = self.valor / otro.valor
+            return Dual(cociente, (self.derivada - cociente * otro.derivada) / otro.valor)
+        return Dual(self.valor / otro, self.derivada / otro)
+
+    def __rtruediv__(self, otro):
+        cociente = otro / self.valor
+        return Dual(cociente, -cociente * self.derivada / self.valor)
+
+    def __pow__(self, exponente):
+        if isinstance(exponente, Dual):
+            return exp(exponente * log(self))
+        if isinstance(exponente, _NUMEROS) and exponente == 0:
+            return Dual(self.valor ** 0, self.derivada * 0)
+        return Dual(
+            self.valor ** exponente,
+            exponente * self.valor ** (exponente - 1) * self.derivada,
+        )
+
+    def __rpow__(self, base):
+        potencia = base ** self.valor
+        return Dual(potencia, potencia * log(base) * self.derivada)
+
+    def __neg__(self):
+        return Dual(-self.valor, -self.derivada)
+
+    def __pos__(self):
+        return self
+
+    # --- Funciones elementales (también las que llama NumPy sobre objetos) ---
+
+    def exp(self):
+        return exp(self)
+
+    def log(self):
+        return log(self)
+
+    def sqrt(self):
+        return sqrt(self)
+
+    def sin(self):
+        return sin(self)
+
+    def cos(self):
+        return cos(self)
+
+    def tan(self):
+        return tan(self)
+
+    def __array_ufunc__(self, ufunc, metodo, *entradas, **kwargs):
+        operacion = _UFUNCS.get(ufunc.__name__)
+        if metodo != "__call__" or kwargs or operacion is None:
+            return NotImplemented
+        return operacion(*(_como_dual(x) for x in entradas))
+
+
+def _como_dual(x):
+    return x if isinstance(x, Dual) else Dual(x, 0.0)
+
+
+def _elemental(nombre):
+    """Evalúa la función de `math` en números y la de NumPy en arreglos."""
+    funcion_math = getattr(math, nombre)
+
+    def evaluar(x):
+        if isinstance(x, _NUMEROS):
+            try:
+                return funcion_math(x)
+            except (OverflowError, ValueError):
+                pass
+        return getattr(_np(), nombre)(x)
+
+    return evaluar
+
+
+_exp = _elemental("exp")
+_log = _elemental("log")
+_sqrt = _elemental("sqrt")
+_sin = _elemental("sin")
+_cos = _elemental("cos")
+_tan = _elemental("tan")
+
+
+# --- Funciones elementales para usar al escribir f ---
+
+def exp(x):
+    if isinstance(x, Dual):
+        valor = exp(x.valor)
+        return Dual(valor, valor * x.derivada)
+    return _exp(x)
+
+def log(x):
+    if isinstance(x, Dual):
+        return Dual(log(x.valor), x.derivada / x.valor)
+    return _log(x)
+
+def sqrt(x):
+    if isinstance(x, Dual):
+        valor = sqrt(x.valor)
+        return Dual(valor, x.derivada / (2 * valor))
+    return _sqrt(x)
+
+def sin(x):
+    if isinstance(x, Dual):
+        return Dual(sin(x.valor), cos(x.valor) * x.derivada)
+    return _sin(x)
+
+def cos(x):
+    if isinstance(x, Dual):
+        return Dual(cos(x.valor), -sin(x.valor) * x.derivada)
+    return _cos(x)
+
+def tan(x):
+    if isinstance(x, Dual):
+        valor = tan(x.valor)
+        return Dual(valor, (1 + valor * valor) * x.derivada)
+    return _tan(x)
+
+
+# Ufuncs de NumPy que se resuelven con aritmética de duales
+_UFUNCS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+    "true_divide": operator.truediv,
+    "power": operator.pow,
+    "negative": operator.neg,
+    "positive": operator.pos,
+    "exp": exp,
+    "log": log,
+    "sqrt": sqrt,
+    "sin": sin,
+    "cos": cos,
+    "tan": tan,
+}
+
+
+# --- Evaluación fusionada ---
+
+def _tipo_flotante(x):
+    # float32 se conserva (precisión mixta); enteros y float64 dan float64
+    return _np().result_type(x, _np().float32)
+
+
+def valor_y_derivada(f, x):
+    """Devuelve (f(x), f'(x)) evaluando f una sola vez con números duales."""
+    if isinstance(x, _NUMEROS):
+        semilla = 1.0
+    else:
+        semilla = _np().ones_like(x, dtype=_tipo_flotante(x))
+    y = f(Dual(x, semilla))
+    if not isinstance(y, Dual):
+        # f no depende de x
+        return y, semilla * 0.0
+    derivada = y.derivada
+    if not isinstance(x, _NUMEROS) and _np().ndim(derivada) < _np().ndim(x):
+        derivada = _np().broadcast_to(derivada, _np().shape(x))
+    return y.valor, derivada
+
+
+def valor_y_derivadas(f, x):
+    """Devuelve (f(x), f'(x), f''(x)) con duales anidados: Dual(Dual(x, 1), Dual(1, 0))."""
+    if isinstance(x, _NUMEROS):
+        uno, cero = 1.0, 0.0
+    else:
+        uno = _np().ones_like(x, dtype=_tipo_flotante(x))
+        cero = uno * 0.0
+    y = f(Dual(Dual(x, uno), Dual(uno, cero)))
+    if not isinstance(y, Dual):
+        return y, cero, cero
+    valor, primera = y.valor, y.derivada
+    if not isinstance(valor, Dual):
+        # f lineal en x: la derivada es constante
+        return valor, primera, cero
+    segunda = primera.derivada if isinstance(primera, Dual) else cero
+    return valor.valor, valor.derivada, segunda
+
+
+def derivada(f):
+    """Devuelve la función f' calculada por diferenciación automática."""
+    def df(x):
+        return valor_y_derivada(f, x)[1]
+    return df
@@ -0,0 +1,272 @@
+"""Ejecución en paralelo de archivos con muchos problemas independientes.
+
+Cada fila es un problema como los de la planilla de los ejercicios:
+ecuación (texto), método, datos iniciales y tolerancia. Las filas se agrupan
+por (ecuación, método) para que cada grupo pase por el método vectorizado,
+y los grupos se reparten entre procesos. Los datos y resultados viven en
+memoria compartida: a cada proceso solo se le envía el nombre de los
+bloques y el tramo de filas que le toca, nunca los arreglos.
+
+Formato de entrada (CSV con encabezado, o JSON Lines con las mismas claves):
+    ecuacion, metodo, a, b, x0, tol, id
+- biseccion: intervalo [a, b]
+- secante:   valores iniciales x_-1 = a, x_0 = b (como secante(f, a, b))
+- newton:    valor inicial x0
+`tol` e `id` son opcionales (por defecto TOL y el número de fila); si falta
+un dato inicial del método, `preparar` lanza ValueError con la fila.
+
+Uso (desde codigo_python/):
+    python -m raices.ejecutor problemas.csv resultados.csv --procesos 8
+"""
+
+import argparse
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from .convenciones import TOL
+from .expresiones import compilar
+from .lote import biseccion_lote, newton_lote, secante_lote
+
+METODOS = ("biseccion", "newton", "secante")
+
+# Filas por tarea: los grupos grandes se dividen para repartir mejor la carga
+TAM_TAREA = 65536
+
+# Bloques de memoria compartida: nombre -> (dtype, filas del arreglo)
+_COLUMNAS = {
+    "entrada": (np.float64, 3),     # p1, p2, tol
+    "raiz": (np.float64, 1),
+    "iteraciones": (np.int64, 1),
+    "estado": (np.int8, 1),
+}
+
+# --- 1. Lectura y escritura ---
+
+def leer_problemas(ruta):
+    """Lee un archivo .csv o .jsonl y devuelve la lista de filas (diccionarios)."""
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        if ruta.endswith((".jsonl", ".json")):
+            return [json.loads(linea) for linea in archivo if linea.strip()]
+        return list(csv.DictReader(archivo))
+
+
+def _numero(fila, clave, i, defecto=None):
+    """Valor numérico de `clave`; si falta, `defecto` o ValueError si es obligatoria."""
+    valor = fila.get(clave)
+    if valor in (None, ""):
+        if defecto is None:
+            raise ValueError(f"Fila {i}: falta {clave!r} para el método {fila['metodo']!r}.")
+        return defecto
+    return float(valor)
+
+
+def preparar(filas):
+    """Convierte las filas en arreglos: (ids, ecuaciones, metodos, entrada[3, n])."""
+    n = len(filas)
+    entrada = np.empty((3, n))
+    ids, ecuaciones, metodos = [], [], []
+
+    for i, fila in enumerate(filas):
+        metodo = fila["metodo"].strip().lower()
+        if metodo not in METODOS:
+            raise ValueError(f"Fila {i}: método desconocido {fila['metodo']!r}.")
+        if metodo == "newton":
+            entrada[0, i] = _numero(fila, "x0", i)
+            entrada[1, i] = np.nan
+        else:
+            entrada[0, i] = _numero(fila, "a", i)
+            entrada[1, i] = _numero(fila, "b", i)
+        entrada[2, i] = _numero(fila, "tol", i, TOL)
+        ids.append(fila.get("id", i))
+        ecuaciones.append(fila["ecuacion"])
+        metodos.append(metodo)
+
+    return ids, ecuaciones, metodos, entrada
+
+
+def escribir_resultados(ruta, ids, raiz, iteraciones, estado):
+    """Escribe los resultados (en el orden de entrada) como .csv o .jsonl."""
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        if ruta.endswith((".jsonl", ".json")):
+            for i in range(len(ids)):
+                archivo.write(json.dumps({
+                    "id": ids[i],
+                    "raiz": None if np.isnan(raiz[i]) else float(raiz[i]),
+                    "iteraciones": int(iteraciones[i]),
+                    "estado": int(estado[i]),
+                }) + "\n")
+            return
+        escritor = csv.writer(archivo)
+        escritor.writerow(["id", "raiz", "iteraciones", "estado"])
+        escritor.writerows(zip(ids, raiz.tolist(), iteraciones.tolist(), estado.tolist()))
+
+# --- 2. Memoria compartida ---
+
+def _crear_bloques(n):
+    bloques = {}
+    for nombre, (dtype, filas) in _COLUMNAS.items():
+        tam = max(np.dtype(dtype).itemsize * filas * n, 1)
+        bloques[nombre] = shared_memory.SharedMemory(create=True, size=tam)
+    return bloques
+
+
+def _vistas(bloques, n):
+    vistas = {}
+    for nombre, (dtype, filas) in _COLUMNAS.items():
+        forma = (filas, n) if filas > 1 else (n,)
+        vistas[nombre] = np.ndarray(forma, dtype=dtype, buffer=bloques[nombre].buf)
+    return vistas
+
+
+def _adjuntar(nombre):
+    """Abre un bloque creado por otro proceso sin registrarlo para liberarlo.
+
+    SharedMemory registra también los bloques que solo se abren, y el
+    registro de recursos los liberaría (o avisaría de una fuga) al terminar
+    este proceso; el único responsable de liberarlos es quien los creó.
+    """
+    registrar = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return shared_memory.SharedMemory(name=nombre)
+    finally:
+        resource_tracker.register = registrar
+
+
+# Bloques ya abiertos en cada proceso de trabajo (se reutilizan entre tareas)
+_ABIERTOS = {}
+
+
+def _abrir_bloques(nombres):
+    clave = tuple(nombres.values())
+    if clave not in _ABIERTOS:
+        for bloques in _ABIERTOS.values():
+            for bloque in bloques.values():
+                bloque.close()
+        _ABIERTOS.clear()
+        _ABIERTOS[clave] = {columna: _adjuntar(nombre) for columna, nombre in nombres.items()}
+    return _ABIERTOS[clave]
+
+# --- 3. Resolución por tramos ---
+
+def _resolver_tramo(vistas, inicio, fin, ecuacion, metodo):
+    """Resuelve las filas [inicio, fin) de un grupo y escribe sus resultados."""
+    p1, p2, tol = vistas["entrada"][:, inicio:fin]
+    expresion = compilar(ecuacion)
+
+    # Los carriles que divergen quedan reportados en `estado`; sus avisos sobran
+    with np.errstate(all="ignore"):
+        if metodo == "biseccion":
+            resultado = biseccion_lote(expresion.f, p1, p2, tol)
+        elif metodo == "secante":
+            resultado = secante_lote(expresion.f, p1, p2, tol)
+        else:
+            resultado = newton_lote(expresion.f, expresion.df, p1, tol)
+
+    vistas["raiz"][inicio:fin] = resultado.raiz
+    vistas["iteraciones"][inicio:fin] = resultado.iteraciones
+    vistas["estado"][inicio:fin] = resultado.estado
+
+
+def _resolver_tramo_en_proceso(nombres, n, inicio, fin, ecuacion, metodo):
+    """Igual que `_resolver_tramo`, en un proceso de trabajo (recibe solo nombres)."""
+    _resolver_tramo(_vistas(_abrir_bloques(nombres), n), inicio, fin, ecuacion, metodo)
+
+
+def _tareas(ecuaciones, metodos, tam_tarea):
+    """Ordena las filas por grupo y devuelve (orden, tareas (inicio, fin, ecuación, método))."""
+    codigos = {}
+    grupo = np.empty(len(ecuaciones), dtype=np.int64)
+    claves = []
+    for i, (ecuacion, metodo) in enumerate(zip(ecuaciones, metodos)):
+        # Se agrupa por la expresión normalizada: "x^2-1" y "x**2 - 1" van juntas
+        clave = (compilar(ecuacion).texto, metodo)
+        if clave not in codigos:
+            codigos[clave] = len(claves)
+            claves.append(clave)
+        grupo[i] = codigos[clave]
+
+    orden = np.argsort(grupo, kind="stable")
+    limites = np.searchsorted(grupo[orden], np.arange(len(claves) + 1))
+
+    tareas = []
+    for codigo, (ecuacion, metodo) in enumerate(claves):
+        for inicio in range(limites[codigo], limites[codigo + 1], tam_tarea):
+            fin = min(inicio + tam_tarea, limites[codigo + 1])
+            tareas.append((int(inicio), int(fin), ecuacion, metodo))
+    return orden, tareas
+
+
+def resolver_lotes(ecuaciones, metodos, entrada, procesos=None, tam_tarea=TAM_TAREA):
+    """Resuelve todos los problemas y devuelve (raiz, iteraciones, estado) en el orden de entrada.
+
+    `entrada` es un arreglo (3, n) con p1, p2 y tol por fila (ver `preparar`).
+    Con procesos=1 todo se resuelve en el proceso actual.
+    """
+    n = entrada.shape[1]
+    procesos = procesos or os.cpu_count() or 1
+    orden, tareas = _tareas(ecuaciones, metodos, tam_tarea)
+
+    bloques = _crear_bloques(n)
+    vistas = None
+    try:
+        vistas = _vistas(bloques, n)
+        vistas["entrada"][:] = entrada[:, orden]
+        nombres = {columna: bloque.name for columna, bloque in bloques.items()}
+
+        if procesos == 1:
+            for tarea in tareas:
+                _resolver_tramo(vistas, *tarea)
+        else:
+            with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+                futuros = [
+                    ejecutor.submit(_resolver_tramo_en_proceso, nombres, n, *tarea)
+                    for tarea in tareas
+                ]
+                for futuro in futuros:
+                    futuro.result()
+
+        # Volver al orden de entrada
+        raiz = np.empty(n)
+        iteraciones = np.empty(n, dtype=np.int64)
+        estado = np.empty(n, dtype=np.int8)
+        raiz[orden] = vistas["raiz"]
+        iteraciones[orden] = vistas["iteraciones"]
+        estado[orden] = vistas["estado"]
+    finally:
+        vistas = None  # Las vistas deben soltarse antes de cerrar los bloques
+        for bloque in bloques.values():
+            bloque.close()
+            bloque.unlink()
+
+    return raiz, iteraciones, estado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m raices.ejecutor",
+        description="Resuelve en paralelo un archivo de problemas (.csv o .jsonl).",
+    )
+    parser.add_argument("entrada", help="archivo de problemas")
+    parser.add_argument("salida", help="archivo de resultados (.csv o .jsonl)")
+    parser.add_argument("--procesos", type=int, default=None,
+                        help="procesos de trabajo (por defecto, uno por núcleo)")
+    parser.add_argument("--tam-tarea", type=int, default=TAM_TAREA,
+                        help=f"filas por tarea (por defecto {TAM_TAREA})")
+    args = parser.parse_args(argv)
+
+    ids, ecuaciones, metodos, entrada = preparar(leer_problemas(args.entrada))
+    raiz, iteraciones, estado = resolver_lotes(
+        ecuaciones, metodos, entrada, args.procesos, args.tam_tarea
+    )
+    escribir_resultados(args.salida, ids, raiz, iteraciones, estado)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,176 @@
+"""Exportación por columnas de las tablas de iteraciones y de los resultados.
+
+`EscritorHistorial` consume los generadores `iterar_*` de muchos problemas y
+guarda, en un directorio:
+- iteraciones.npy: todas las iteraciones (arreglo estructurado, una fila por iteración)
+- resultados.npy:  una fila por problema, con el tramo [inicio, fin) de sus iteraciones
+- iteraciones.csv: la misma tabla en texto (opcional)
+
+Las filas se acumulan en un búfer y se escriben por bloques grandes, no una
+línea por iteración. `LectorHistorial` abre iteraciones.npy como memoria
+mapeada, así que se puede pedir la tabla de un problema sin cargar el resto.
+"""
+
+import csv
+import os
+import shutil
+
+import numpy as np
+
+from .metodos import Resultado
+
+DTYPE_ITERACION = np.dtype([
+    ("problema", np.int64),
+    ("k", np.int32),
+    ("x", np.float64),
+    ("fx", np.float64),
+    ("paso", np.float64),
+    ("a", np.float64),
+    ("b", np.float64),
+    ("dfx", np.float64),
+])
+
+DTYPE_RESULTADO = np.dtype([
+    ("problema", np.int64),
+    ("metodo", "U20"),  # "newton_modificado" tiene 17 caracteres
+    ("inicio", np.int64),
+    ("fin", np.int64),
+    ("raiz", np.float64),
+    ("iteraciones", np.int32),
+    ("estado", np.int8),
+])
+
+# Filas del búfer de iteraciones
+TAM_BLOQUE = 65536
+
+
+def _o_nan(valor):
+    return np.nan if valor is None else valor
+
+
+class EscritorHistorial:
+    """Escribe las iteraciones y resultados de muchos problemas en `directorio`.
+
+    Uso:
+        with EscritorHistorial("salida") as escritor:
+            for i, (a, b) in enumerate(intervalos):
+                escritor.registrar(i, iterar_biseccion(f, a, b))
+    """
+
+    def __init__(self, directorio, con_csv=True, tam_bloque=TAM_BLOQUE):
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self._bufer = np.empty(tam_bloque, dtype=DTYPE_ITERACION)
+        self._n_bufer = 0
+        self._total = 0
+        self._resultados = []
+
+        # Las filas se vuelcan crudas y al cerrar se les antepone el encabezado .npy
+        self._ruta_cruda = os.path.join(directorio, "iteraciones.bin")
+        self._crudo = open(self._ruta_cruda, "wb")
+
+        self._csv = None
+        if con_csv:
+            self._csv = open(os.path.join(directorio, "iteraciones.csv"), "w", newline="")
+            self._escritor_csv = csv.writer(self._csv)
+            self._escritor_csv.writerow(DTYPE_ITERACION.names)
+
+    def agregar(self, problema, registro):
+        """Agrega una `Iteracion` del problema indicado."""
+        if self._n_bufer == self._bufer.size:
+            self._volcar()
+        self._bufer[self._n_bufer] = (
+            problema, registro.k, registro.x, registro.fx,
+            _o_nan(registro.paso), _o_nan(registro.a), _o_nan(registro.b),
+            _o_nan(registro.dfx),
+        )
+        self._n_bufer += 1
+
+    def registrar(self, problema, iteraciones):
+        """Consume un generador `iterar_*` guardando sus iteraciones; devuelve el `Resultado`."""
+        inicio = self._total + self._n_bufer
+        for registro in iteraciones:
+            if isinstance(registro, Resultado):
+                break
+            self.agregar(problema, registro)
+        fin = self._total + self._n_bufer
+        self._resultados.append((
+            problema, registro.metodo, inicio, fin,
+            _o_nan(registro.raiz), registro.iteraciones, registro.estado,
+        ))
+        return registro
+
+    def _volcar(self):
+        bloque = self._bufer[:self._n_bufer]
+        bloque.tofile(self._crudo)
+        if self._csv is not None:
+            self._escritor_csv.writerows(bloque.tolist())
+        self._total += self._n_bufer
+        self._n_bufer = 0
+
+    def cerrar(self):
+        self._volcar()
+        self._crudo.close()
+        if self._csv is not None:
+            self._csv.close()
+
+        # iteraciones.npy = encabezado + las filas crudas, sin cargarlas en memoria
+        encabezado = {
+            "descr": np.lib.format.dtype_to_descr(DTYPE_ITERACION),
+            "fortran_order": False,
+            "shape": (self._total,),
+        }
+        with open(os.path.join(self.directorio, "iteraciones.npy"), "wb") as destino:
+            np.lib.format.write_array_header_1_0(destino, encabezado)
+            with open(self._ruta_cruda, "rb") as origen:
+                shutil.copyfileobj(origen, destino, 1 << 20)
+        os.remove(self._ruta_cruda)
+
+        resultados = np.array(self._resultados, dtype=DTYPE_RESULTADO)
+        np.save(os.path.join(self.directorio, "resultados.npy"), resultados)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class LectorHistorial:
+    """Lee un directorio escrito por `EscritorHistorial` sin cargar las iteraciones."""
+
+    def __init__(self, directorio):
+        self.iteraciones = np.load(os.path.join(directorio, "iteraciones.npy"), mmap_mode="r")
+        self.resultados = np.load(os.path.join(directorio, "resultados.npy"), mmap_mode="r")
+        self._orden = np.argsort(self.resultados["problema"], kind="stable")
+        self._ids = self.resultados["problema"][self._orden]
+
+    def _fila(self, problema):
+        i = np.searchsorted(self._ids, problema)
+        if i == self._ids.size or self._ids[i] != problema:
+            raise KeyError(problema)
+        return self.resultados[self._orden[i]]
+
+    def resultado(self, problema):
+        """Fila de `resultados` del problema."""
+        return self._fila(problema)
+
+    def __getitem__(self, problema):
+        """Iteraciones del problema (una vista de la memoria mapeada)."""
+        fila = self._fila(problema)
+        return self.iteraciones[fila["inicio"]:fila["fin"]]
+
+    def __len__(self):
+        return self._ids.size
+
+
+def exportar_npz(directorio, ruta):
+    """Empaqueta iteraciones y resultados en un .npz comprimido (para transferir).
+
+    Un .npz no se puede mapear en memoria; para leer por problema se usa el
+    directorio con `LectorHistorial`.
+    """
+    lector = LectorHistorial(directorio)
+    np.savez_compressed(
+        ruta, iteraciones=np.asarray(lector.iteraciones), resultados=np.asarray(lector.resultados)
+    )
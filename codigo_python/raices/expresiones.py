@@ -0,0 +1,302 @@
+"""Compilador de ecuaciones escritas como texto, p. ej. "x**3 - 0.5*x**2 + 4*x - 1".
+
+La expresión se analiza con `ast` (solo se aceptan números, la variable x,
++ - * / ** y funciones elementales), se deriva simbólicamente y se genera
+código Python vectorizado con NumPy para f, f' y ambas a la vez. Cada
+subexpresión se calcula una sola vez (eliminación de subexpresiones comunes):
+en "x**3 - exp(0.8*x) - 20", exp(0.8*x) se comparte entre f y f'.
+
+Los núcleos compilados se guardan en una caché LRU indexada por la expresión
+normalizada, así que repetir una ecuación no vuelve a compilarla.
+"""
+
+import ast
+import math
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+Expresion = namedtuple("Expresion", ["texto", "f", "df", "valor_y_derivada", "fuente"])
+
+# Expresiones compiladas que se conservan en la caché
+TAM_CACHE = 256
+
+# Funciones permitidas -> función de NumPy que las evalúa
+FUNCIONES = {
+    "exp": "np.exp",
+    "log": "np.log",
+    "sqrt": "np.sqrt",
+    "sin": "np.sin",
+    "cos": "np.cos",
+    "tan": "np.tan",
+}
+
+CONSTANTES = {"pi": math.pi, "e": math.e}
+
+_OPERADORES = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.Pow: "**",
+}
+
+# --- 1. Árbol de la expresión ---
+# Nodos: ("num", valor), ("x",), (op, a, b) con op en + - * / **,
+# ("neg", a) y ("fun", nombre, a). Son tuplas, así que nodos iguales son
+# iguales y se pueden usar como claves para compartir subexpresiones.
+
+X = ("x",)
+CERO = ("num", 0.0)
+UNO = ("num", 1.0)
+
+
+def _num(valor):
+    return ("num", float(valor))
+
+
+def _es_num(nodo, valor=None):
+    return nodo[0] == "num" and (valor is None or nodo[1] == valor)
+
+
+def _binario(op, a, b):
+    """Construye a op b simplificando los casos triviales."""
+    if _es_num(a) and _es_num(b):
+        try:
+            valor = _evaluar_constante(op, a[1], b[1])
+        except (ZeroDivisionError, OverflowError, ValueError):
+            valor = None
+        if isinstance(valor, float) and math.isfinite(valor):
+            return _num(valor)
+    if op == "+":
+        if _es_num(a, 0.0):
+            return b
+        if _es_num(b, 0.0):
+            return a
+    elif op == "-":
+        if _es_num(b, 0.0):
+            return a
+        if _es_num(a, 0.0):
+            return _negativo(b)
+    elif op == "*":
+        if _es_num(a, 0.0) or _es_num(b, 0.0):
+            return CERO
+        if _es_num(a, 1.0):
+            return b
+        if _es_num(b, 1.0):
+            return a
+    elif op == "/":
+        if _es_num(a, 0.0):
+            return CERO
+        if _es_num(b, 1.0):
+            return a
+    elif op == "**":
+        if _es_num(b, 0.0):
+            return UNO
+        if _es_num(b, 1.0):
+            return a
+    return (op, a, b)
+
+
+def _evaluar_constante(op, a, b):
+    if op == "+":
+        return a + b
+    if op == "-":
+        return a - b
+    if op == "*":
+        return a * b
+    if op == "/":
+        return a / b
+    return a ** b
+
+
+def _negativo(a):
+    if _es_num(a):
+        return _num(-a[1])
+    if a[0] == "neg":
+        return a[1]
+    return ("neg", a)
+
+
+def _funcion(nombre, a):
+    return ("fun", nombre, a)
+
+
+def analizar(texto):
+    """Convierte el texto en un árbol. Acepta ^ como potencia."""
+    try:
+        arbol = ast.parse(texto.replace("^", "**"), mode="eval").body
+    except SyntaxError as error:
+        raise ValueError(f"Expresión inválida: {texto!r}") from error
+    return _desde_ast(arbol, texto)
+
+
+def _desde_ast(nodo, texto):
+    if isinstance(nodo, ast.Constant) and type(nodo.value) in (int, float):
+        return _num(nodo.value)
+    if isinstance(nodo, ast.Name):
+        if nodo.id == "x":
+            return X
+        if nodo.id in CONSTANTES:
+            return _num(CONSTANTES[nodo.id])
+    if isinstance(nodo, ast.BinOp) and type(nodo.op) in _OPERADORES:
+        return _binario(
+            _OPERADORES[type(nodo.op)],
+            _desde_ast(nodo.left, texto),
+            _desde_ast(nodo.right, texto),
+        )
+    if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, (ast.UAdd, ast.USub)):
+        operando = _desde_ast(nodo.operand, texto)
+        return operando if isinstance(nodo.op, ast.UAdd) else _negativo(operando)
+    if (isinstance(nodo, ast.Call) and isinstance(nodo.func, ast.Name)
+            and nodo.func.id in FUNCIONES and len(nodo.args) == 1 and not nodo.keywords):
+        return _funcion(nodo.func.id, _desde_ast(nodo.args[0], texto))
+    raise ValueError(f"Expresión no permitida en {texto!r}: {ast.unparse(nodo)!r}")
+
+
+def _texto_numero(valor):
+    # Los negativos van entre paréntesis: -2.0 ** x sería -(2.0 ** x)
+    return repr(valor) if valor >= 0 else f"({valor!r})"
+
+
+def texto_normalizado(nodo):
+    """Texto canónico del árbol (con todos los paréntesis)."""
+    tipo = nodo[0]
+    if tipo == "num":
+        return _texto_numero(nodo[1])
+    if tipo == "x":
+        return "x"
+    if tipo == "neg":
+        return f"(-{texto_normalizado(nodo[1])})"
+    if tipo == "fun":
+        return f"{nodo[1]}({texto_normalizado(nodo[2])})"
+    return f"({texto_normalizado(nodo[1])} {tipo} {texto_normalizado(nodo[2])})"
+
+# --- 2. Derivación simbólica ---
+
+def derivar(nodo):
+    """Derivada del árbol respecto de x."""
+    tipo = nodo[0]
+    if tipo == "num":
+        return CERO
+    if tipo == "x":
+        return UNO
+    if tipo == "neg":
+        return _negativo(derivar(nodo[1]))
+    if tipo == "fun":
+        return _binario("*", _derivada_funcion(nodo[1], nodo[2], nodo), derivar(nodo[2]))
+
+    _, a, b = nodo
+    da, db = derivar(a), derivar(b)
+    if tipo in ("+", "-"):
+        return _binario(tipo, da, db)
+    if tipo == "*":
+        return _binario("+", _binario("*", da, b), _binario("*", a, db))
+    if tipo == "/":
+        # (a/b)' = (a' - (a/b) b') / b
+        return _binario("/", _binario("-", da, _binario("*", nodo, db)), b)
+    # Potencia
+    if _es_num(b):
+        n = b[1]
+        return _binario("*", _binario("*", b, _binario("**", a, _num(n - 1))), da)
+    # a^b = exp(b log a): (a^b)' = a^b (b' log a + b a' / a)
+    return _binario("*", nodo, _binario(
+        "+", _binario("*", db, _funcion("log", a)), _binario("/", _binario("*", b, da), a)
+    ))
+
+
+def _derivada_funcion(nombre, a, nodo):
+    """Derivada de nombre(a) respecto de a; `nodo` es nombre(a), para reutilizarlo."""
+    if nombre == "exp":
+        return nodo
+    if nombre == "log":
+        return _binario("/", UNO, a)
+    if nombre == "sqrt":
+        return _binario("/", _num(0.5), nodo)
+    if nombre == "sin":
+        return _funcion("cos", a)
+    if nombre == "cos":
+        return _negativo(_funcion("sin", a))
+    # tan
+    return _binario("+", UNO, _binario("*", nodo, nodo))
+
+# --- 3. Generación de código con subexpresiones comunes ---
+
+class _Generador:
+    """Emite una asignación por subexpresión distinta; las repetidas se reutilizan."""
+
+    def __init__(self):
+        self.lineas = []
+        self.nombres = {}
+
+    def emitir(self, nodo):
+        tipo = nodo[0]
+        if tipo == "num":
+            return _texto_numero(nodo[1])
+        if tipo == "x":
+            return "x"
+        if nodo in self.nombres:
+            return self.nombres[nodo]
+
+        if tipo == "neg":
+            codigo = f"-{self.emitir(nodo[1])}"
+        elif tipo == "fun":
+            codigo = f"{FUNCIONES[nodo[1]]}({self.emitir(nodo[2])})"
+        else:
+            codigo = f"{self.emitir(nodo[1])} {tipo} {self.emitir(nodo[2])}"
+
+        nombre = f"t{len(self.nombres)}"
+        self.nombres[nodo] = nombre
+        self.lineas.append(f"    {nombre} = {codigo}")
+        return nombre
+
+    def resultado(self, nodo):
+        """Expresión de retorno; las constantes toman la forma de x."""
+        if nodo[0] == "num":
+            return f"_constante({nodo[1]!r}, x)"
+        return self.emitir(nodo)
+
+
+def _constante(valor, x):
+    return valor if np.ndim(x) == 0 else np.full(np.shape(x), valor)
+
+
+def generar_fuente(arbol, derivada):
+    """Código de los núcleos f(x), df(x) y valor_y_derivada(x)."""
+    bloques = []
+    for nombre, nodos in (("f", [arbol]), ("df", [derivada]),
+                          ("valor_y_derivada", [arbol, derivada])):
+        generador = _Generador()
+        retornos = [generador.resultado(nodo) for nodo in nodos]
+        cuerpo = generador.lineas + [f"    return {', '.join(retornos)}"]
+        bloques.append("\n".join([f"def {nombre}(x):"] + cuerpo))
+    return "\n\n".join(bloques) + "\n"
+
+# --- 4. Compilación con caché ---
+
+@lru_cache(maxsize=TAM_CACHE)
+def _compilar_normalizada(normalizada):
+    arbol = analizar(normalizada)
+    fuente = generar_fuente(arbol, derivar(arbol))
+    espacio = {"np": np, "_constante": _constante}
+    exec(compile(fuente, f"<expresion {normalizada}>", "exec"), espacio)
+    return Expresion(
+        normalizada, espacio["f"], espacio["df"], espacio["valor_y_derivada"], fuente
+    )
+
+
+@lru_cache(maxsize=TAM_CACHE)
+def compilar(texto):
+    """Compila la ecuación `texto` (en la variable x) a núcleos vectorizados.
+
+    Devuelve una `Expresion` con f, df y valor_y_derivada, que aceptan
+    escalares o arreglos de NumPy. Lanza ValueError si el texto no es una
+    expresión válida.
+    """
+    return _compilar_normalizada(texto_normalizado(analizar(texto)))
+
+
+def limpiar_cache():
+    compilar.cache_clear()
+    _compilar_normalizada.cache_clear()
@@ -0,0 +1,97 @@
+"""Conteo de evaluaciones de f y df, y tiempos por llamada y por resolución.
+
+El número de iteraciones no refleja el costo real: la Secante evalúa `f` una
+vez por iteración (más una al inicio) y Newton-Raphson evalúa `f` y `df`. Aquí se envuelven las
+funciones para contar cada llamada. Sin instrumentar no hay ningún costo
+extra: `instrumentar(f, activo=False)` devuelve la misma `f`.
+"""
+
+from collections import namedtuple
+from time import perf_counter
+
+
+class FuncionInstrumentada:
+    """Envuelve una función: cuenta llamadas y evaluaciones y acumula su tiempo.
+
+    Con arreglos, una llamada cuenta tantas evaluaciones como elementos.
+    `gancho(nombre, x, y, dt)` se invoca tras cada llamada, si se indica.
+    """
+
+    __slots__ = ("funcion", "nombre", "gancho", "llamadas", "evaluaciones", "tiempo")
+
+    def __init__(self, funcion, nombre="f", gancho=None):
+        self.funcion = funcion
+        self.nombre = nombre
+        self.gancho = gancho
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.llamadas = 0
+        self.evaluaciones = 0
+        self.tiempo = 0.0
+
+    def __call__(self, x):
+        t0 = perf_counter()
+        y = self.funcion(x)
+        dt = perf_counter() - t0
+
+        self.llamadas += 1
+        self.evaluaciones += getattr(x, "size", 1)
+        self.tiempo += dt
+        if self.gancho is not None:
+            self.gancho(self.nombre, x, y, dt)
+        return y
+
+
+def instrumentar(funcion, nombre="f", gancho=None, activo=True):
+    """Devuelve `funcion` instrumentada, o la misma función si activo=False."""
+    if not activo or funcion is None:
+        return funcion
+    return FuncionInstrumentada(funcion, nombre, gancho)
+
+
+class Costo(namedtuple("Costo", [
+    "llamadas_f", "evaluaciones_f", "tiempo_f",
+    "llamadas_df", "evaluaciones_df", "tiempo_df",
+    "tiempo_total",
+])):
+    """Costo de una resolución (tiempos en segundos)."""
+
+    __slots__ = ()
+
+    @property
+    def evaluaciones(self):
+        """Evaluaciones totales de f y df."""
+        return self.evaluaciones_f + self.evaluaciones_df
+
+    @property
+    def tiempo_por_llamada_f(self):
+        return self.tiempo_f / self.llamadas_f if self.llamadas_f else 0.0
+
+    @property
+    def tiempo_por_llamada_df(self):
+        return self.tiempo_df / self.llamadas_df if self.llamadas_df else 0.0
+
+
+def medir(metodo, f, *args, df=None, gancho=None, **kwargs):
+    """Ejecuta `metodo` instrumentando f (y df) y devuelve (resultado, Costo).
+
+    Se llama como metodo(f, df, *args) si se pasa `df` (Newton-Raphson) y
+    como metodo(f, *args) en caso contrario.
+    """
+    fi = FuncionInstrumentada(f, "f", gancho)
+    dfi = FuncionInstrumentada(df, "df", gancho) if df is not None else None
+    argumentos = (fi, dfi) + args if dfi is not None else (fi,) + args
+
+    t0 = perf_counter()
+    resultado = metodo(*argumentos, **kwargs)
+    tiempo_total = perf_counter() - t0
+
+    costo = Costo(
+        fi.llamadas, fi.evaluaciones, fi.tiempo,
+        dfi.llamadas if dfi else 0,
+        dfi.evaluaciones if dfi else 0,
+        dfi.tiempo if dfi else 0.0,
+        tiempo_total,
+    )
+    return resultado, costo
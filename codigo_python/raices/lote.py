@@ -0,0 +1,217 @@
+"""Métodos vectorizados: resuelven miles de problemas en una sola llamada.
+
+Cada función evalúa `f` una vez por iteración sobre todos los carriles
+(elementos) activos a la vez y descarta los que ya terminaron. Los criterios
+de parada son los mismos de las versiones escalares, así que los resultados
+coinciden elemento a elemento.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .convenciones import (
+    CONVERGIDO,
+    DIVISION_CERO,
+    EPS_DIVISION,
+    MAX_ITER,
+    MAX_ITERACIONES,
+    RAIZ_EXACTA,
+    SIN_CAMBIO_SIGNO,
+    TOL,
+)
+from .dual import valor_y_derivada
+
+ResultadoLote = namedtuple("ResultadoLote", ["raiz", "iteraciones", "estado"])
+ResultadoNewtonLote = namedtuple(
+    "ResultadoNewtonLote", ["raiz", "iteraciones", "paso", "estado"]
+)
+
+
+# --- 1. Método de Bisección por lotes ---
+
+def biseccion_lote(f, a, b, tol=TOL, max_iter=MAX_ITER):
+    """Bisección sobre arreglos de intervalos [a, b] (tol puede ser un arreglo).
+
+    `f` debe aceptar arreglos de NumPy. Devuelve un `ResultadoLote` con
+    arreglos de raíces, iteraciones y códigos de estado.
+    """
+    a, b, tol = np.broadcast_arrays(
+        np.asarray(a, dtype=float), np.asarray(b, dtype=float), np.asarray(tol, dtype=float)
+    )
+    forma = a.shape
+    a = a.ravel().copy()
+    b = b.ravel().copy()
+    tol = tol.ravel()
+
+    fa = f(a)
+    fb = f(b)
+
+    raiz = np.full(a.size, np.nan)
+    iteraciones = np.zeros(a.size, dtype=np.int64)
+    estado = np.full(a.size, MAX_ITERACIONES, dtype=np.int8)
+
+    sin_cambio = fa * fb > 0
+    estado[sin_cambio] = SIN_CAMBIO_SIGNO
+
+    # Índices de los carriles que siguen iterando
+    activos = np.flatnonzero(~sin_cambio)
+    fa = fa[activos]
+
+    for i in range(max_iter):
+        if activos.size == 0:
+            break
+
+        a_k = a[activos]
+        b_k = b[activos]
+        p = (a_k + b_k) / 2
+        fp = f(p)
+
+        raiz[activos] = p
+        iteraciones[activos] = i + 1
+
+        # Criterio de parada: Ancho del intervalo (Error Absoluto)
+        convergido = np.abs(b_k - a_k) / 2 < tol[activos]
+        exacta = (fp == 0) & ~convergido
+        estado[activos[convergido]] = CONVERGIDO
+        estado[activos[exacta]] = RAIZ_EXACTA
+
+        # Actualizar el intervalo de los carriles que continúan
+        sigue = ~(convergido | exacta)
+        izquierda = fa * fp < 0
+        b[activos[sigue & izquierda]] = p[sigue & izquierda]
+        derecha = sigue & ~izquierda
+        a[activos[derecha]] = p[derecha]
+        fa = np.where(derecha, fp, fa)  # Actualizar f(a)
+
+        activos = activos[sigue]
+        fa = fa[sigue]
+
+    return ResultadoLote(
+        raiz.reshape(forma), iteraciones.reshape(forma), estado.reshape(forma)
+    )
+
+
+# --- 2. Método de Newton-Raphson por lotes ---
+
+def newton_lote(f, df, x0, tol=TOL, max_iter=MAX_ITER):
+    """Newton-Raphson desde un arreglo de valores iniciales x0.
+
+    Los carriles que convergen o cuya derivada es casi nula se congelan sin
+    detener a los demás. Con df=None, f y f' se obtienen en una sola pasada
+    por diferenciación automática. Devuelve un `ResultadoNewtonLote` con la
+    raíz, las iteraciones, el último paso |x_k+1 - x_k| y el código de estado.
+    """
+    x0, tol = np.broadcast_arrays(np.asarray(x0, dtype=float), np.asarray(tol, dtype=float))
+    forma = x0.shape
+    x_k = x0.ravel().copy()
+    tol = tol.ravel()
+
+    iteraciones = np.zeros(x_k.size, dtype=np.int64)
+    paso = np.full(x_k.size, np.nan)
+    estado = np.full(x_k.size, MAX_ITERACIONES, dtype=np.int8)
+
+    activos = np.arange(x_k.size)
+
+    for i in range(max_iter):
+        if activos.size == 0:
+            break
+
+        x = x_k[activos]
+        if df is None:
+            fx, dfx = valor_y_derivada(f, x)
+        else:
+            fx = f(x)
+            dfx = df(x)
+
+        # Evitar división por cero: se congela el carril en x_k
+        nula = np.abs(dfx) < EPS_DIVISION
+        estado[activos[nula]] = DIVISION_CERO
+
+        sigue = ~nula
+        activos = activos[sigue]
+        x_nuevo = x[sigue] - fx[sigue] / dfx[sigue]
+        error_abs = np.abs(x_nuevo - x[sigue])
+
+        x_k[activos] = x_nuevo
+        paso[activos] = error_abs
+        iteraciones[activos] = i + 1
+
+        # Criterio de parada: Error Absoluto |x_k_nuevo - x_k|
+        convergido = error_abs < tol[activos]
+        estado[activos[convergido]] = CONVERGIDO
+        activos = activos[~convergido]
+
+    return ResultadoNewtonLote(
+        x_k.reshape(forma),
+        iteraciones.reshape(forma),
+        paso.reshape(forma),
+        estado.reshape(forma),
+    )
+
+
+# --- 3. Método de la Secante por lotes ---
+
+def secante_lote(f, x_menos_1, x0, tol=TOL, max_iter=MAX_ITER):
+    """Secante desde arreglos de pares iniciales (x_-1, x0).
+
+    f(x_k) se reutiliza como f(x_k-1) en la iteración siguiente, así que se
+    evalúa `f` una vez por iteración en lugar de dos (los resultados son los
+    mismos que los de la versión escalar). Devuelve un `ResultadoNewtonLote`.
+    """
+    x_menos_1, x0, tol = np.broadcast_arrays(
+        np.asarray(x_menos_1, dtype=float), np.asarray(x0, dtype=float), np.asarray(tol, dtype=float)
+    )
+    forma = x0.shape
+    x_k_menos_1 = x_menos_1.ravel().copy()
+    x_k = x0.ravel().copy()
+    tol = tol.ravel()
+
+    iteraciones = np.zeros(x_k.size, dtype=np.int64)
+    paso = np.full(x_k.size, np.nan)
+    estado = np.full(x_k.size, MAX_ITERACIONES, dtype=np.int8)
+
+    activos = np.arange(x_k.size)
+    fx_menos_1 = f(x_k_menos_1)
+    fx_k = f(x_k)
+
+    for i in range(max_iter):
+        if activos.size == 0:
+            break
+
+        # Evitar división por cero: se congela el carril en x_k
+        nulo = np.abs(fx_k - fx_menos_1) < EPS_DIVISION
+        estado[activos[nulo]] = DIVISION_CERO
+
+        sigue = ~nulo
+        activos = activos[sigue]
+        xm, xk = x_k_menos_1[activos], x_k[activos]
+        fm, fk = fx_menos_1[sigue], fx_k[sigue]
+
+        # Fórmula de la Secante
+        x_k_mas_1 = xk - fk * (xm - xk) / (fm - fk)
+        error_abs = np.abs(x_k_mas_1 - xk)
+
+        paso[activos] = error_abs
+        iteraciones[activos] = i + 1
+
+        # Criterio de parada: Error Absoluto |x_k_mas_1 - x_k|
+        convergido = error_abs < tol[activos]
+        estado[activos[convergido]] = CONVERGIDO
+        x_k[activos[convergido]] = x_k_mas_1[convergido]
+
+        sigue = ~convergido
+        activos = activos[sigue]
+        if activos.size == 0:
+            break
+        x_k_menos_1[activos] = xk[sigue]
+        x_k[activos] = x_k_mas_1[sigue]
+        fx_menos_1 = fk[sigue]
+        fx_k = f(x_k_mas_1[sigue])
+
+    return ResultadoNewtonLote(
+        x_k.reshape(forma),
+        iteraciones.reshape(forma),
+        paso.reshape(forma),
+        estado.reshape(forma),
+    )
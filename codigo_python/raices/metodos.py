@@ -0,0 +1,653 @@
+"""Métodos escalares: Bisección, Newton-Raphson, Secante, Brent, Halley y Steffensen.
+
+Son los métodos de los ejercicios (ejer1.py - ejer4.py), pero reciben la
+función `f` (y su derivada `df`) como argumento en lugar de usar una global.
+
+Cada método es un generador (`iterar_*`) que produce un registro `Iteracion`
+por paso y termina con un `Resultado`. La tabla de los ejercicios es solo uno
+de los consumidores posibles (`imprimir_tabla`); con registrar=False el
+generador no produce registros, solo el `Resultado`. `iterar_aitken` acelera
+la sucesión de otro generador, y `convergencia` estima el orden observado.
+`iterar_newton_modificado` detecta raíces múltiples y recupera la
+convergencia cuadrática.
+"""
+
+import math
+import sys
+from collections import namedtuple
+
+from .convenciones import (
+    CONVERGIDO,
+    DESCRIPCION_ESTADO,
+    DIVISION_CERO,
+    EPS_DIVISION,
+    MAX_ITER,
+    MAX_ITERACIONES,
+    RAIZ_EXACTA,
+    SIN_CAMBIO_SIGNO,
+    TOL,
+)
+from .dual import valor_y_derivada, valor_y_derivadas
+
+# Épsilon de máquina, para la tolerancia relativa del método de Brent
+EPS = sys.float_info.epsilon
+
+# Steffensen: |h| no supera esta fracción de max(|x|, 1)
+PASO_STEFFENSEN = 1e-2
+
+# Registro de una iteración:
+#   x, fx: punto evaluado y f(x)
+#   paso:  en los métodos abiertos, x_k+1 - x_k; en los de intervalo, el semiancho
+#   a, b:  intervalo (solo en los métodos de intervalo); dfx: f'(x) (Newton y Halley)
+Iteracion = namedtuple(
+    "Iteracion", ["k", "x", "fx", "paso", "a", "b", "dfx"], defaults=(None, None, None)
+)
+
+
+class Resultado(namedtuple("Resultado", ["metodo", "raiz", "iteraciones", "estado"])):
+    """Resultado final de un método. Se imprime como en los ejercicios."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        if self.estado == CONVERGIDO:
+            return f"Raíz encontrada: {self.raiz:.6f} en {self.iteraciones} iteraciones."
+        if self.estado == RAIZ_EXACTA:
+            return f"Raíz exacta: {self.raiz:.6f} en {self.iteraciones} iteraciones."
+        if self.estado == SIN_CAMBIO_SIGNO:
+            return "El intervalo inicial no encierra la raíz (no hay cambio de signo)."
+        if self.estado == MAX_ITERACIONES:
+            return f"Convergencia lenta. Última aproximación: {self.raiz:.6f}"
+        if self.estado == DIVISION_CERO:
+            if self.metodo == "secante":
+                return "División por cero (denominador nulo)."
+            return "División por cero (derivada cercana a cero)."
+        return DESCRIPCION_ESTADO.get(self.estado, "Estado desconocido")
+
+
+# --- 1. Método de Bisección ---
+
+def iterar_biseccion(f, a, b, tol=TOL, registrar=True):
+    fa = f(a)
+    fb = f(b)
+
+    if fa * fb > 0:
+        yield Resultado("biseccion", None, 0, SIN_CAMBIO_SIGNO)
+        return
+
+    p = 0
+
+    for i in range(MAX_ITER): # Límite de iteraciones
+        p = (a + b) / 2
+        fp = f(p)
+        semiancho = abs(b - a) / 2
+
+        if registrar:
+            yield Iteracion(i + 1, p, fp, semiancho, a, b)
+
+        # Criterio de parada: Ancho del intervalo (Error Absoluto)
+        if semiancho < tol:
+            yield Resultado("biseccion", p, i + 1, CONVERGIDO)
+            return
+
+        if fp == 0:
+            yield Resultado("biseccion", p, i + 1, RAIZ_EXACTA)
+            return
+
+        if fa * fp < 0:
+            b = p
+        else:
+            a = p
+            fa = fp # Actualizar f(a)
+
+    yield Resultado("biseccion", p, MAX_ITER, MAX_ITERACIONES)
+
+# --- 2. Método de Newton-Raphson ---
+
+def iterar_newton(f, df, x0, tol=TOL, registrar=True):
+    """Con df=None, f y f' se obtienen juntas por diferenciación automática."""
+    x_k = x0
+
+    for i in range(MAX_ITER): # Límite de iteraciones
+        if df is None:
+            fx, dfx = valor_y_derivada(f, x_k)
+        else:
+            fx = f(x_k)
+            dfx = df(x_k)
+
+        if abs(dfx) < EPS_DIVISION: # Evitar división por cero
+            yield Resultado("newton", x_k, i, DIVISION_CERO)
+            return
+
+        x_k_nuevo = x_k - fx / dfx
+        error_abs = abs(x_k_nuevo - x_k)
+
+        if registrar:
+            yield Iteracion(i + 1, x_k, fx, x_k_nuevo - x_k, dfx=dfx)
+
+        # Criterio de parada: Error Absoluto |x_k_nuevo - x_k|
+        if error_abs < tol:
+            yield Resultado("newton", x_k_nuevo, i + 1, CONVERGIDO)
+            return
+
+        x_k = x_k_nuevo
+
+    yield Resultado("newton", x_k, MAX_ITER, MAX_ITERACIONES)
+
+# --- 3. Método de la Secante ---
+
+def iterar_secante(f, x_menos_1, x0, tol=TOL, registrar=True):
+    x_k_menos_1 = x_menos_1
+    x_k = x0
+    fx_k = f(x_k_menos_1) # Pasa a fx_menos_1 en la primera iteración
+
+    for i in range(MAX_ITER): # Límite de iteraciones
+        # f(x_k_menos_1) es el f(x_k) de la iteración anterior: una evaluación por paso
+        fx_menos_1 = fx_k
+        fx_k = f(x_k)
+
+        if abs(fx_k - fx_menos_1) < EPS_DIVISION: # Evitar división por cero
+            yield Resultado("secante", x_k, i, DIVISION_CERO)
+            return
+
+        # Fórmula de la Secante
+        x_k_mas_1 = x_k - fx_k * (x_k_menos_1 - x_k) / (fx_menos_1 - fx_k)
+        error_abs = abs(x_k_mas_1 - x_k)
+
+        if registrar:
+            yield Iteracion(i + 1, x_k, fx_k, x_k_mas_1 - x_k)
+
+        # Criterio de parada: Error Absoluto |x_k_mas_1 - x_k|
+        if error_abs < tol:
+            yield Resultado("secante", x_k_mas_1, i + 1, CONVERGIDO)
+            return
+
+        x_k_menos_1 = x_k
+        x_k = x_k_mas_1
+
+    yield Resultado("secante", x_k, MAX_ITER, MAX_ITERACIONES)
+
+
+def _segundo_inicial(x):
+    # Segundo valor inicial de la secante cuando solo hay uno (como scipy.optimize.newton)
+    return x * (1 + 1e-4) + (1e-4 if x >= 0 else -1e-4)
+
+# --- 4. Método de Brent (híbrido) ---
+
+def iterar_brent(f, a, b, tol=TOL, registrar=True):
+    """Método de Brent: interpolación cuadrática inversa o secante, con bisección de respaldo.
+
+    Mantiene siempre un intervalo con cambio de signo [b, c] (seguro como la
+    bisección) pero avanza con pasos de secante cerca de la raíz. `b` es la
+    mejor aproximación; el criterio de parada |c - b| / 2 <= tol / 2 garantiza
+    un error absoluto menor que tol.
+
+    Las interpolaciones pueden achicar el intervalo muy poco (por ejemplo en
+    raíces triples). Para no usar nunca más iteraciones que la bisección,
+    cada punto nuevo se acerca al punto medio lo necesario para que, aun si
+    el paso no sirve, las bisecciones que quedan lleven el semiancho debajo
+    de tol en las iteraciones que usaría `iterar_biseccion` (como en el
+    método ITP). Además cada punto se corre un poco hacia el punto medio,
+    para que el intervalo no se achique siempre por el mismo lado. En esa
+    iteración se devuelve el punto medio, con el mismo error que la bisección.
+    """
+    fa = f(a)
+    fb = f(b)
+
+    if fa * fb > 0:
+        yield Resultado("brent", None, 0, SIN_CAMBIO_SIGNO)
+        return
+
+    # Iteraciones de la bisección sobre [a, b] (criterio semiancho < tol)
+    iteraciones_biseccion = 1
+    ancho_inicial = abs(b - a)
+    semiancho = ancho_inicial / 2
+    while semiancho >= tol and iteraciones_biseccion < MAX_ITER:
+        semiancho /= 2
+        iteraciones_biseccion += 1
+    # Semiancho buscado en esa iteración: debajo de tol con margen para el redondeo
+    semiancho_final = (tol + semiancho) / 2
+
+    c, fc = b, fb
+    d = e = b - a
+
+    for i in range(MAX_ITER): # Límite de iteraciones
+        # Mantener el cambio de signo entre b y c
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+
+        # b debe ser la mejor aproximación (|f(b)| mínimo)
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * EPS * abs(b) + tol / 2
+        m = (c - b) / 2
+
+        if registrar:
+            yield Iteracion(i + 1, b, fb, abs(m), min(b, c), max(b, c))
+
+        # Criterio de parada: Ancho del intervalo (Error Absoluto)
+        if abs(m) <= tol1:
+            yield Resultado("brent", b, i + 1, CONVERGIDO)
+            return
+
+        if fb == 0:
+            yield Resultado("brent", b, i + 1, RAIZ_EXACTA)
+            return
+
+        # En las iteraciones de la bisección, el punto medio ya tiene su error
+        restantes = iteraciones_biseccion - (i + 1)
+        if restantes <= 0 and abs(m) < tol:
+            yield Resultado("brent", b + m, i + 1, CONVERGIDO)
+            return
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Interpolación cuadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+
+            # Aceptar la interpolación solo si cae dentro del intervalo y reduce el paso
+            if 2 * p < min(3 * m * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = m # Bisección
+        else:
+            d = e = m # Bisección
+
+        a, fa = b, fb
+        paso = d if abs(d) > tol1 else (tol1 if m > 0 else -tol1)
+
+        # Un poco hacia el punto medio (del lado lejano de la raíz estimada),
+        # para que el intervalo se cierre por los dos lados
+        desvio = 0.1 * (2 * m) ** 2 / ancho_inicial
+        if abs(paso - m) > desvio:
+            paso += math.copysign(desvio, m - paso)
+        else:
+            paso = m
+
+        # Distancia máxima al punto medio: con un paso inútil, el semiancho
+        # nuevo (|m| + distancia) / 2 debe seguir en el ritmo de la bisección
+        radio = semiancho_final * 2.0 ** restantes - abs(m)
+        if abs(paso - m) > radio:
+            paso = m + math.copysign(max(radio, 0.0), paso - m)
+            d = e = paso
+        b += paso
+        fb = f(b)
+
+    yield Resultado("brent", b, MAX_ITER, MAX_ITERACIONES)
+
+# --- 5. Método de Halley (orden 3) ---
+
+def iterar_halley(f, df, d2f, x0, tol=TOL, registrar=True):
+    """x_k+1 = x_k - 2 f f' / (2 f'^2 - f f'').
+
+    Con df=None o d2f=None, f, f' y f'' se obtienen juntas por diferenciación
+    automática (duales anidados).
+    """
+    x_k = x0
+
+    for i in range(MAX_ITER): # Límite de iteraciones
+        if df is None or d2f is None:
+            fx, dfx, d2fx = valor_y_derivadas(f, x_k)
+        else:
+            fx = f(x_k)
+            dfx = df(x_k)
+            d2fx = d2f(x_k)
+
+        denominador = 2 * dfx * dfx - fx * d2fx
+        if abs(denominador) < EPS_DIVISION: # Evitar división por cero
+            yield Resultado("halley", x_k, i, DIVISION_CERO)
+            return
+
+        x_k_nuevo = x_k - 2 * fx * dfx / denominador
+        error_abs = abs(x_k_nuevo - x_k)
+
+        if registrar:
+            yield Iteracion(i + 1, x_k, fx, x_k_nuevo - x_k, dfx=dfx)
+
+        # Criterio de parada: Error Absoluto |x_k_nuevo - x_k|
+        if error_abs < tol:
+            yield Resultado("halley", x_k_nuevo, i + 1, CONVERGIDO)
+            return
+
+        x_k = x_k_nuevo
+
+    yield Resultado("halley", x_k, MAX_ITER, MAX_ITERACIONES)
+
+# --- 6. Método de Steffensen (orden 2, sin derivadas) ---
+
+def iterar_steffensen(f, x0, tol=TOL, registrar=True):
+    """Newton con f'(x) ~ (f(x + f(x)) - f(x)) / f(x): dos evaluaciones de f por paso.
+
+    La división por cero se juzga sobre la pendiente estimada, no sobre el
+    numerador f(x + f(x)) - f(x), que tiende a 0 junto con f(x).
+
+    Lejos de la raíz, f(x) puede ser grande frente a x (en ejer1, f(3.5) ~ 6.4)
+    y la pendiente entre x y x + f(x) no se parece a f'(x): el método se
+    arrastra con orden ~1. Por eso |h| se limita a PASO_STEFFENSEN *
+    max(|x|, 1); cerca de la raíz h = f(x) y el orden sigue siendo 2.
+    """
+    x_k = x0
+
+    for i in range(MAX_ITER): # Límite de iteraciones
+        fx = f(x_k)
+        if fx == 0:
+            yield Resultado("steffensen", x_k, i, RAIZ_EXACTA)
+            return
+
+        # h = f(x) (acotado) tiende a 0 con el método; si x + h ya no se
+        # distingue de x (f(x) por debajo del redondeo de x), se usa un h mínimo
+        escala = max(abs(x_k), 1.0)
+        h = math.copysign(min(abs(fx), PASO_STEFFENSEN * escala), fx)
+        if x_k + h == x_k:
+            h = math.copysign(math.sqrt(EPS) * escala, fx)
+        denominador = f(x_k + h) - fx # ~ f'(x) h
+        if abs(denominador) < EPS_DIVISION * abs(h): # Evitar división por cero (f' ~ 0)
+            yield Resultado("steffensen", x_k, i, DIVISION_CERO)
+            return
+
+        x_k_nuevo = x_k - fx * h / denominador
+        error_abs = abs(x_k_nuevo - x_k)
+
+        if registrar:
+            yield Iteracion(i + 1, x_k, fx, x_k_nuevo - x_k)
+
+        # Criterio de parada: Error Absoluto |x_k_nuevo - x_k|
+        if error_abs < tol:
+            yield Resultado("steffensen", x_k_nuevo, i + 1, CONVERGIDO)
+            return
+
+        x_k = x_k_nuevo
+
+    yield Resultado("steffensen", x_k, MAX_ITER, MAX_ITERACIONES)
+
+# --- 7. Aceleración Δ² de Aitken ---
+
+def iterar_aitken(iteraciones, tol=TOL, registrar=True):
+    """Acelera la sucesión x_k de otro generador `iterar_*` (creado con registrar=True).
+
+    Con tres aproximaciones seguidas, x' = x_k - (Δx_k)^2 / Δ²x_k. Sirve para
+    sucesiones de convergencia lineal con razón de error estable (Newton en
+    raíces múltiples, iteraciones de punto fijo). Se detiene cuando dos
+    valores acelerados seguidos difieren en menos de tol; si el método base
+    termina antes, devuelve su resultado. `iteraciones` cuenta las del método base.
+
+    En los métodos de intervalo (bisección) el error no decrece con razón
+    constante y Δ² se estanca en valores falsos, así que se muestran los
+    valores acelerados pero la parada es la del método base.
+    """
+    xs = []
+    acelerado = None
+
+    for registro in iteraciones:
+        if isinstance(registro, Resultado):
+            yield registro._replace(metodo="aitken")
+            return
+
+        xs.append(registro.x)
+        if len(xs) < 3:
+            continue
+        x0, x1, x2 = xs[-3:]
+        diferencia2 = x2 - 2 * x1 + x0
+        if abs(diferencia2) < EPS_DIVISION:
+            nuevo = x2 # Sin curvatura: no hay nada que acelerar
+        else:
+            nuevo = x2 - (x2 - x1) ** 2 / diferencia2
+
+        if acelerado is not None:
+            if registrar:
+                yield Iteracion(registro.k, nuevo, registro.fx, nuevo - acelerado)
+
+            # Criterio de parada: Error Absoluto entre valores acelerados
+            if registro.a is None and abs(nuevo - acelerado) < tol:
+                iteraciones.close()
+                yield Resultado("aitken", nuevo, registro.k, CONVERGIDO)
+                return
+        acelerado = nuevo
+
+    yield Resultado("aitken", acelerado, len(xs), MAX_ITERACIONES)
+
+# --- 8. Newton modificado para raíces múltiples ---
+
+def multiplicidad(f, x, df=None, d2f=None):
+    """Estimación de la multiplicidad de la raíz cercana a x: f'^2 / (f'^2 - f f'').
+
+    Si f = (x - r)^m g(x), el cociente tiende a m cuando x -> r (en la raíz
+    misma es 0/0: conviene evaluarlo en una aproximación). Sin df o d2f
+    las derivadas se obtienen por diferenciación automática.
+    """
+    if df is None or d2f is None:
+        fx, dfx, d2fx = valor_y_derivadas(f, x)
+    else:
+        fx, dfx, d2fx = f(x), df(x), d2f(x)
+    denominador = dfx * dfx - fx * d2fx
+    if denominador == 0:
+        return float("inf")
+    return dfx * dfx / denominador
+
+
+def iterar_newton_modificado(f, df, x0, tol=TOL, registrar=True):
+    """Newton que detecta raíces múltiples y pasa a x_k+1 = x_k - m f / f'.
+
+    Con el paso m' f / f' en una raíz de multiplicidad m, cada paso es
+    (1 - m' / m) del anterior; de la razón r entre pasos seguidos se estima
+    m = m' / (1 - r) (con m' = 1, Newton normal: m = 1 / (1 - r)). La
+    estimación se repite en cada paso: cuando dos seguidas dan el mismo
+    entero distinto del m' actual, se pasa a ese. Así se corrige un m mal
+    elegido antes del régimen asintótico, y en raíces simples muy cercanas
+    (que al principio parecen una múltiple) se vuelve a m = 1. Si un paso
+    se pasa de largo (razón <= -1/2) o no achica el error, m se corrige en
+    el acto, sin dar ese paso.
+
+    Cerca de una raíz múltiple f' -> 0 junto con f, pero f / f' sigue bien
+    definido: con m >= 2 solo se detiene por división si f' es exactamente 0.
+    """
+    x_k = x0
+    m = 1
+    paso_anterior = estimacion_anterior = None
+
+    for i in range(MAX_ITER): # Límite de iteraciones
+        if df is None:
+            fx, dfx = valor_y_derivada(f, x_k)
+        else:
+            fx = f(x_k)
+            dfx = df(x_k)
+
+        if fx == 0:
+            yield Resultado("newton_modificado", x_k, i, RAIZ_EXACTA)
+            return
+
+        if dfx == 0 or (m == 1 and abs(dfx) < EPS_DIVISION): # Evitar división por cero
+            yield Resultado("newton_modificado", x_k, i, DIVISION_CERO)
+            return
+
+        paso = -m * fx / dfx
+
+        # Estimación de la multiplicidad con la razón entre pasos seguidos (mismo m)
+        confirmada = False
+        if paso_anterior is not None:
+            razon = paso / paso_anterior
+            if razon >= 1:
+                # Los pasos no se achican: no hay una raíz múltiple a la vista
+                estimacion = 1
+            else:
+                estimacion = max(1, round(m / (1 - razon)))
+            if estimacion < m and (razon <= -0.5 or razon >= 1):
+                # El paso con m se pasa de largo o no achica el error: se
+                # corrige sin esperar confirmación y sin darlo (f y f' sirven
+                # para el nuevo paso)
+                m, estimacion = estimacion, None
+                paso = -m * fx / dfx
+            elif estimacion != m and estimacion == estimacion_anterior:
+                m, estimacion, confirmada = estimacion, None, True
+            estimacion_anterior = estimacion
+        x_k_nuevo = x_k + paso
+
+        if registrar:
+            yield Iteracion(i + 1, x_k, fx, paso, dfx=dfx)
+
+        # Criterio de parada: Error Absoluto |x_k_nuevo - x_k|
+        if abs(paso) < tol:
+            yield Resultado("newton_modificado", x_k_nuevo, i + 1, CONVERGIDO)
+            return
+
+        # Este paso se dio con el m anterior: no sirve para la razón del siguiente
+        paso_anterior = None if confirmada else paso
+        x_k = x_k_nuevo
+
+    yield Resultado("newton_modificado", x_k, MAX_ITER, MAX_ITERACIONES)
+
+# --- 9. Consumidores ---
+
+# Título, encabezado y fila de la tabla de cada método
+TABLAS = {
+    "biseccion": (
+        "=== Método de Bisección ===",
+        "{:<5} {:<10} {:<10} {:<10} {:<15}".format("k", "a", "b", "p", "f(p)"),
+        lambda it: "{:<5} {:<10.6f} {:<10.6f} {:<10.6f} {:<15.6f}".format(it.k, it.a, it.b, it.x, it.fx),
+    ),
+    "newton": (
+        "=== Método de Newton-Raphson ===",
+        "{:<5} {:<15} {:<15} {:<15} {:<15}".format("k", "x_k", "f(x_k)", "f'(x_k)", "Error Abs"),
+        lambda it: "{:<5} {:<15.8f} {:<15.8f} {:<15.8f} {:<15.8f}".format(it.k, it.x, it.fx, it.dfx, abs(it.paso)),
+    ),
+    "secante": (
+        "=== Método de la Secante ===",
+        "{:<5} {:<15} {:<15} {:<15} {:<15}".format("k", "x_k", "f(x_k)", "x_k+1", "Error Abs"),
+        lambda it: "{:<5} {:<15.8f} {:<15.8f} {:<15.8f} {:<15.8f}".format(it.k, it.x, it.fx, it.x + it.paso, abs(it.paso)),
+    ),
+    "brent": (
+        "=== Método de Brent (híbrido) ===",
+        "{:<5} {:<10} {:<10} {:<10} {:<15}".format("k", "a", "b", "x_k", "f(x_k)"),
+        lambda it: "{:<5} {:<10.6f} {:<10.6f} {:<10.6f} {:<15.6f}".format(it.k, it.a, it.b, it.x, it.fx),
+    ),
+    "newton_modificado": (
+        "=== Método de Newton modificado (raíces múltiples) ===",
+        "{:<5} {:<15} {:<15} {:<15} {:<15}".format("k", "x_k", "f(x_k)", "f'(x_k)", "Error Abs"),
+        lambda it: "{:<5} {:<15.8f} {:<15.8f} {:<15.8f} {:<15.8f}".format(it.k, it.x, it.fx, it.dfx, abs(it.paso)),
+    ),
+    "halley": (
+        "=== Método de Halley ===",
+        "{:<5} {:<15} {:<15} {:<15} {:<15}".format("k", "x_k", "f(x_k)", "f'(x_k)", "Error Abs"),
+        lambda it: "{:<5} {:<15.8f} {:<15.8f} {:<15.8f} {:<15.8f}".format(it.k, it.x, it.fx, it.dfx, abs(it.paso)),
+    ),
+    "steffensen": (
+        "=== Método de Steffensen ===",
+        "{:<5} {:<15} {:<15} {:<15} {:<15}".format("k", "x_k", "f(x_k)", "x_k+1", "Error Abs"),
+        lambda it: "{:<5} {:<15.8f} {:<15.8f} {:<15.8f} {:<15.8f}".format(it.k, it.x, it.fx, it.x + it.paso, abs(it.paso)),
+    ),
+    "aitken": (
+        "=== Aceleración de Aitken ===",
+        "{:<5} {:<15} {:<15} {:<15}".format("k", "x acelerado", "f(x_k) base", "Error Abs"),
+        lambda it: "{:<5} {:<15.8f} {:<15.8f} {:<15.8f}".format(it.k, it.x, it.fx, abs(it.paso)),
+    ),
+}
+
+
+def resultado_final(iteraciones):
+    """Consume el generador sin mostrar nada y devuelve el `Resultado`."""
+    for registro in iteraciones:
+        pass
+    return registro
+
+
+def orden_observado(xs):
+    """Estimaciones del orden de convergencia a partir de las aproximaciones x_k.
+
+    Con e_k = |x_k+1 - x_k|, q ~ log(e_k+1 / e_k) / log(e_k / e_k-1): 1 para
+    convergencia lineal, ~1.6 para la secante, 2 para Newton, 3 para Halley.
+    Hacen falta al menos cuatro aproximaciones.
+    """
+    e = [abs(b - a) for a, b in zip(xs, xs[1:])]
+    ordenes = []
+    for e0, e1, e2 in zip(e, e[1:], e[2:]):
+        if e0 > 0 and e1 > 0 and e2 > 0 and e1 != e0:
+            ordenes.append(math.log(e2 / e1) / math.log(e1 / e0))
+    return ordenes
+
+
+def convergencia(iteraciones):
+    """Consume el generador (creado con registrar=True) y devuelve (`Resultado`, orden).
+
+    El orden es la última estimación de `orden_observado` (None si hubo
+    muy pocas iteraciones para estimarlo).
+    """
+    xs = []
+    for registro in iteraciones:
+        if isinstance(registro, Resultado):
+            break
+        xs.append(registro.x)
+    if registro.raiz is not None:
+        xs.append(registro.raiz)
+    ordenes = orden_observado(xs)
+    return registro, (ordenes[-1] if ordenes else None)
+
+
+def imprimir_tabla(iteraciones, metodo, titulo=None):
+    """Consume el generador imprimiendo la tabla del método y devuelve el `Resultado`."""
+    titulo_metodo, encabezado, fila = TABLAS[metodo]
+    print(f"\n{titulo or titulo_metodo}")
+    print(encabezado)
+    for registro in iteraciones:
+        if isinstance(registro, Resultado):
+            return registro
+        # MOSTRAR ITERACIÓN
+        print(fila(registro))
+
+
+def _ejecutar(iteraciones, metodo, mostrar):
+    if mostrar:
+        return imprimir_tabla(iteraciones, metodo)
+    return resultado_final(iteraciones)
+
+# --- 10. Interfaz de los ejercicios ---
+
+def biseccion(f, a, b, tol=TOL, mostrar=True):
+    return _ejecutar(iterar_biseccion(f, a, b, tol, registrar=mostrar), "biseccion", mostrar)
+
+
+def newton_raphson(f, df, x0, tol=TOL, mostrar=True):
+    return _ejecutar(iterar_newton(f, df, x0, tol, registrar=mostrar), "newton", mostrar)
+
+
+def secante(f, x_menos_1, x0, tol=TOL, mostrar=True):
+    return _ejecutar(iterar_secante(f, x_menos_1, x0, tol, registrar=mostrar), "secante", mostrar)
+
+
+def brent(f, a, b, tol=TOL, mostrar=True):
+    return _ejecutar(iterar_brent(f, a, b, tol, registrar=mostrar), "brent", mostrar)
+
+
+def newton_modificado(f, df, x0, tol=TOL, mostrar=True):
+    return _ejecutar(
+        iterar_newton_modificado(f, df, x0, tol, registrar=mostrar), "newton_modificado", mostrar
+    )
+
+
+def halley(f, df, d2f, x0, tol=TOL, mostrar=True):
+    return _ejecutar(iterar_halley(f, df, d2f, x0, tol, registrar=mostrar), "halley", mostrar)
+
+
+def steffensen(f, x0, tol=TOL, mostrar=True):
+    return _ejecutar(iterar_steffensen(f, x0, tol, registrar=mostrar), "steffensen", mostrar)
+
+
+def aitken(iteraciones, tol=TOL, mostrar=True):
+    """Acelera un generador `iterar_*` creado con registrar=True (ver `iterar_aitken`)."""
+    return _ejecutar(iterar_aitken(iteraciones, tol, registrar=mostrar), "aitken", mostrar)
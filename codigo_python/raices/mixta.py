@@ -0,0 +1,200 @@
+"""Precisión mixta por lotes: el grueso de las iteraciones en float32 y el final en float64.
+
+Lejos de la raíz la precisión de float64 no aporta nada. Aquí cada método
+corre primero en float32 (la mitad de memoria por carril y el doble de
+elementos por instrucción SIMD) y después pule cada carril en float64 con el
+mismo criterio de parada de la versión float64 (`lote`):
+
+- Newton y secante: uno o dos pasos en float64 desde la raíz float32.
+- Bisección: se sigue bisecando en float64 desde el intervalo final de
+  float32, que antes se comprueba en float64 (debe haber cambio de signo).
+
+La fase float32 recorre todos los carriles con operaciones enteras sobre el
+arreglo (`np.where`) en lugar de seleccionar los activos con índices: en
+float32 evaluar f es tan barato que seleccionar costaría más que evaluar de
+más. Termina cuando quedan pocos carriles activos; esos siguen en float64.
+
+Garantía: todo carril que termina en CONVERGIDO cumplió en float64 el
+criterio |x_k+1 - x_k| < tol (o semiancho < tol), la misma cota de error
+que la versión float64. No es el mismo punto: la raíz de la versión mixta y
+la de la float64 pueden diferir hasta en 2 * tol (cada una a menos de tol de
+la raíz; en bisección con tol = TOL se ven diferencias de casi 2e-4), que es lo
+que comprueba `benchmarks/bench_mixta`. Los carriles que no
+convergen en el pulido (división por cero, sin cambio de signo, rango de
+float32 excedido) se resuelven de nuevo enteros en float64: su resultado es
+exactamente el de la versión float64. Como con cualquier cambio de
+redondeo, si el intervalo tiene varias raíces o el x0 está en una zona donde
+Newton es caótico, el carril puede llegar a otra raíz.
+
+Las iteraciones informadas son las de ambas fases.
+"""
+
+import numpy as np
+
+from .convenciones import CONVERGIDO, MAX_ITER, TOL
+from .dual import valor_y_derivada
+from .lote import ResultadoLote, ResultadoNewtonLote, biseccion_lote, newton_lote, secante_lote
+
+# Iteraciones float64 para pulir un carril antes de rehacerlo entero en float64
+PASOS_PULIDO = 3
+
+# La fase float32 termina cuando quedan activos menos de esta fracción de carriles
+FRACCION_ACTIVOS = 1 / 16
+
+_EPS32 = float(np.finfo(np.float32).eps)
+
+
+def _tol32(tol, escala):
+    # float32 no puede dar pasos menores que unos pocos ulp: sin este piso los
+    # carriles con tol muy chica no terminarían nunca la fase float32
+    return np.maximum(tol, 8 * _EPS32 * np.abs(escala)).astype(np.float32)
+
+
+def _preparar(*arreglos):
+    arreglos = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in arreglos))
+    return arreglos[0].shape, [x.ravel() for x in arreglos]
+
+
+def _quedan_pocos(activo):
+    return np.count_nonzero(activo) <= FRACCION_ACTIVOS * activo.size
+
+# --- 1. Fases float32 ---
+# Desbordes y nan que solo ocurren por el rango de float32 no se avisan: esos
+# carriles no convergen en el pulido y se rehacen en float64.
+
+def _biseccion32(f, a, b, tol, max_iter):
+    """Devuelve el intervalo final [a, b] en float32 y las iteraciones de cada carril."""
+    a = a.astype(np.float32)
+    b = b.astype(np.float32)
+    tol = _tol32(tol, np.maximum(np.abs(a), np.abs(b)))
+    iteraciones = np.zeros(a.size, dtype=np.int64)
+
+    with np.errstate(all="ignore"):
+        negativa_a = np.signbit(f(a))
+        for _ in range(max_iter):
+            sigue = np.abs(b - a) / 2 >= tol
+            if _quedan_pocos(sigue):
+                break
+            p = (a + b) / 2
+            # Se compara el signo, no fa * fp < 0 (el producto se anula en float32)
+            izquierda = negativa_a != np.signbit(f(p))
+            b = np.where(sigue & izquierda, p, b)
+            a = np.where(sigue & ~izquierda, p, a)
+            iteraciones += sigue
+    return a, b, iteraciones
+
+
+def _newton32(f, df, x0, tol, max_iter):
+    x = x0.astype(np.float32)
+    tol = _tol32(tol, x)
+    activo = np.ones(x.size, dtype=bool)
+    iteraciones = np.zeros(x.size, dtype=np.int64)
+
+    with np.errstate(all="ignore"):
+        for _ in range(max_iter):
+            if df is None:
+                fx, dfx = valor_y_derivada(f, x)
+            else:
+                fx, dfx = f(x), df(x)
+            paso = fx / dfx
+            x = np.where(activo, x - paso, x)
+            iteraciones += activo
+            activo &= ~(np.abs(paso) < tol) & np.isfinite(x)
+            if _quedan_pocos(activo):
+                break
+    return x, iteraciones
+
+
+def _secante32(f, x_menos_1, x0, tol, max_iter):
+    x_ant = x_menos_1.astype(np.float32)
+    x = x0.astype(np.float32)
+    tol = _tol32(tol, x)
+    activo = np.ones(x.size, dtype=bool)
+    iteraciones = np.zeros(x.size, dtype=np.int64)
+
+    with np.errstate(all="ignore"):
+        f_ant = f(x_ant)
+        fx = f(x)
+        for _ in range(max_iter):
+            x_nuevo = x - fx * (x_ant - x) / (f_ant - fx)
+            x_ant = np.where(activo, x, x_ant)
+            f_ant = np.where(activo, fx, f_ant)
+            avance = np.abs(x_nuevo - x)
+            x = np.where(activo, x_nuevo, x)
+            iteraciones += activo
+            activo &= ~(avance < tol) & np.isfinite(x)
+            if _quedan_pocos(activo):
+                break
+            fx = np.where(activo, f(x), fx)
+    return x_ant, x, iteraciones
+
+# --- 2. Pulido en float64 ---
+
+def _completar(iteraciones32, fina, resolver_en_float64, forma):
+    """Une las fases y rehace en float64 los carriles que el pulido no hizo converger."""
+    raiz = fina.raiz.copy()
+    iteraciones = iteraciones32 + fina.iteraciones
+    estado = fina.estado.copy()
+    paso = getattr(fina, "paso", None)
+    paso = None if paso is None else paso.copy()
+
+    rehacer = np.flatnonzero(estado != CONVERGIDO)
+    if rehacer.size:
+        completa = resolver_en_float64(rehacer)
+        raiz[rehacer] = completa.raiz
+        iteraciones[rehacer] += completa.iteraciones
+        estado[rehacer] = completa.estado
+        if paso is not None:
+            paso[rehacer] = completa.paso
+
+    if paso is None:
+        return ResultadoLote(raiz.reshape(forma), iteraciones.reshape(forma), estado.reshape(forma))
+    return ResultadoNewtonLote(
+        raiz.reshape(forma), iteraciones.reshape(forma), paso.reshape(forma), estado.reshape(forma)
+    )
+
+
+def _finitos(x, respaldo):
+    x = x.astype(float)
+    return np.where(np.isfinite(x), x, respaldo)
+
+# --- 3. Métodos ---
+
+def biseccion_mixta(f, a, b, tol=TOL, max_iter=MAX_ITER):
+    """Como `biseccion_lote`, con precisión mixta. Devuelve un `ResultadoLote`."""
+    forma, (a, b, tol) = _preparar(a, b, tol)
+    a32, b32, iteraciones32 = _biseccion32(f, a, b, tol, max_iter)
+
+    fina = biseccion_lote(f, _finitos(a32, a), _finitos(b32, b), tol, max_iter)
+    return _completar(
+        iteraciones32, fina, lambda i: biseccion_lote(f, a[i], b[i], tol[i], max_iter), forma
+    )
+
+
+def newton_mixta(f, df, x0, tol=TOL, max_iter=MAX_ITER):
+    """Como `newton_lote`, con precisión mixta. Devuelve un `ResultadoNewtonLote`."""
+    forma, (x0, tol) = _preparar(x0, tol)
+    x32, iteraciones32 = _newton32(f, df, x0, tol, max_iter)
+
+    fina = newton_lote(f, df, _finitos(x32, x0), tol, PASOS_PULIDO)
+    return _completar(
+        iteraciones32, fina, lambda i: newton_lote(f, df, x0[i], tol[i], max_iter), forma
+    )
+
+
+def secante_mixta(f, x_menos_1, x0, tol=TOL, max_iter=MAX_ITER):
+    """Como `secante_lote`, con precisión mixta. Devuelve un `ResultadoNewtonLote`."""
+    forma, (x_menos_1, x0, tol) = _preparar(x_menos_1, x0, tol)
+    anterior32, x32, iteraciones32 = _secante32(f, x_menos_1, x0, tol, max_iter)
+
+    # Se pule desde los dos últimos puntos float32; si el último paso float32
+    # fue nulo, el segundo punto se toma a unos ulp de float32
+    inicio = _finitos(x32, x0)
+    anterior = _finitos(anterior32, x_menos_1)
+    iguales = anterior == inicio
+    anterior[iguales] += 16 * _EPS32 * np.maximum(np.abs(inicio[iguales]), 1.0)
+
+    fina = secante_lote(f, anterior, inicio, tol, PASOS_PULIDO)
+    return _completar(
+        iteraciones32, fina, lambda i: secante_lote(f, x_menos_1[i], x0[i], tol[i], max_iter), forma
+    )
@@ -0,0 +1,169 @@
+"""Polinomios: evaluación de Horner, todas las raíces y deflación.
+
+Los polinomios se dan como arreglo de coeficientes, del grado mayor al
+término independiente (la convención de `np.polyval` y `np.roots`):
+
+    x^3 - 0.5x^2 + 4x - 1   ->   [1, -0.5, 4, -1]
+
+`horner` evalúa p y p' juntos en una sola pasada, sin potencias. `raices`
+obtiene todas las raíces a la vez como autovalores de la matriz compañera
+(o por Newton con deflación) y las pule con Newton sobre el polinomio
+original. `raices_lote` hace lo mismo para muchos polinomios del mismo grado
+en una sola llamada vectorizada.
+"""
+
+import numpy as np
+
+from .convenciones import MAX_ITER, TOL
+from .metodos import EPS
+
+# Pasos de Newton para pulir las raíces (cada uno solo se acepta si reduce |p|)
+PASOS_PULIDO = 3
+
+# --- 1. Evaluación ---
+
+def horner(coef, x):
+    """Devuelve (p(x), p'(x)) con el esquema de Horner. `x` puede ser un arreglo."""
+    p = coef[0] * x ** 0
+    dp = 0 * p
+    for c in coef[1:]:
+        dp = dp * x + p
+        p = p * x + c
+    return p, dp
+
+
+def funciones(coef):
+    """Devuelve (f, df) para usar el polinomio con los métodos de `metodos` y `lote`."""
+    coef = [float(c) for c in coef]
+
+    def f(x):
+        p = coef[0]
+        for c in coef[1:]:
+            p = p * x + c
+        return p
+
+    def df(x):
+        return horner(coef, x)[1]
+
+    return f, df
+
+
+def deflactar(coef, raiz):
+    """Divide p(x) por (x - raiz) (división sintética); devuelve (cociente, resto)."""
+    coef = np.asarray(coef)
+    cociente = np.empty(coef.size - 1, dtype=np.result_type(coef, raiz))
+    acumulado = coef[0]
+    for i in range(1, coef.size):
+        cociente[i - 1] = acumulado
+        acumulado = acumulado * raiz + coef[i]
+    return cociente, acumulado
+
+# --- 2. Raíces de un polinomio ---
+
+def _normalizar(coef):
+    coef = np.trim_zeros(np.atleast_1d(np.asarray(coef, dtype=float)), "f")
+    if coef.size == 0:
+        raise ValueError("El polinomio nulo no tiene raíces aisladas.")
+    return coef
+
+
+def _companera(coef):
+    """Matrices compañeras de los polinomios (una por fila de `coef`)."""
+    m, n = coef.shape[0], coef.shape[1] - 1
+    matriz = np.zeros((m, n, n), dtype=coef.dtype)
+    matriz[:, 0, :] = -coef[:, 1:] / coef[:, :1]
+    matriz[:, np.arange(1, n), np.arange(n - 1)] = 1
+    return matriz
+
+
+def _pulir(coef, z, pasos):
+    """Pasos de Newton sobre el polinomio original (por filas), solo si reducen |p|."""
+    coef = coef[..., None]
+    p, dp = horner(np.moveaxis(coef, -2, 0), z)
+    for _ in range(pasos):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidato = z - p / dp
+        p_nuevo, dp_nuevo = horner(np.moveaxis(coef, -2, 0), candidato)
+        mejora = np.isfinite(candidato) & (np.abs(p_nuevo) < np.abs(p))
+        if not mejora.any():
+            break
+        z = np.where(mejora, candidato, z)
+        p = np.where(mejora, p_nuevo, p)
+        dp = np.where(mejora, dp_nuevo, dp)
+    return z
+
+
+def _newton_complejo(coef, z, tol):
+    for _ in range(MAX_ITER):
+        p, dp = horner(coef, z)
+        if dp == 0:
+            z += tol  # Punto crítico: moverse un poco y seguir
+            continue
+        paso = p / dp
+        z -= paso
+        if abs(paso) < tol * max(abs(z), 1):
+            break
+    return z
+
+
+def _por_deflacion(coef, tol):
+    """Newton en el plano complejo sobre p, deflactando cada raíz encontrada."""
+    restante = coef.astype(complex)
+    raices = []
+    while restante.size > 2:
+        # Arranque fuera del eje real, para poder llegar a raíces complejas
+        z = _newton_complejo(restante, complex(0.4, 0.9), tol)
+        raices.append(z)
+        restante, _ = deflactar(restante, z)
+    raices.append(-restante[1] / restante[0])
+    return np.array(raices)
+
+
+def raices(coef, metodo="companera", pulir=True):
+    """Todas las raíces (complejas) del polinomio.
+
+    metodo="companera" usa los autovalores de la matriz compañera;
+    metodo="deflacion", Newton complejo con deflación. Con pulir=True cada
+    raíz se refina con Newton sobre el polinomio original (la deflación
+    acumula errores de redondeo en las últimas raíces).
+    """
+    coef = _normalizar(coef)
+    if coef.size == 1:
+        return np.empty(0, dtype=complex)
+
+    if metodo == "companera":
+        z = np.linalg.eigvals(_companera(coef[None, :])[0]).astype(complex)
+    elif metodo == "deflacion":
+        z = _por_deflacion(coef, 4 * EPS)
+    else:
+        raise ValueError(f"Método desconocido {metodo!r}; use 'companera' o 'deflacion'.")
+
+    if pulir:
+        z = _pulir(coef[None, :], z[None, :], PASOS_PULIDO)[0]
+    return z[np.lexsort((z.imag, z.real))]
+
+
+def raices_reales(coef, tol=TOL, pulir=True):
+    """Raíces reales, en orden creciente (parte imaginaria menor que tol)."""
+    z = raices(coef, pulir=pulir)
+    return np.sort(z.real[np.abs(z.imag) < tol])
+
+# --- 3. Muchos polinomios del mismo grado ---
+
+def raices_lote(coefs, pulir=True):
+    """Raíces de muchos polinomios del mismo grado (una fila de coeficientes cada uno).
+
+    Devuelve un arreglo complejo (m, grado). El coeficiente principal de cada
+    fila debe ser distinto de cero.
+    """
+    coefs = np.atleast_2d(np.asarray(coefs, dtype=float))
+    if coefs.shape[1] < 2:
+        return np.empty((coefs.shape[0], 0), dtype=complex)
+    if np.any(coefs[:, 0] == 0):
+        raise ValueError("Todos los polinomios deben tener coeficiente principal no nulo.")
+
+    z = np.linalg.eigvals(_companera(coefs)).astype(complex)
+    if pulir:
+        z = _pulir(coefs, z, PASOS_PULIDO)
+    orden = np.lexsort((z.imag, z.real), axis=-1)
+    return np.take_along_axis(z, orden, axis=-1)
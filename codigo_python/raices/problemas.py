@@ -0,0 +1,137 @@
+"""Problemas de los ejercicios (ejer1.py - ejer4.py) y los datos para reproducirlos.
+
+Las funciones con exp/cos/sin tienen dos núcleos: uno con `math` para
+escalares (varias veces más rápido que NumPy sobre un float) y otro con NumPy
+para arreglos, que solo se importa la primera vez que se evalúa un arreglo.
+"""
+
+import math
+from collections import namedtuple
+
+Problema = namedtuple("Problema", ["nombre", "expresion", "f", "df"])
+
+# encabezado: lo que imprime el script antes de los métodos
+# raiz_id: número de raíz en los títulos de ejer1/ejer2 (None usa los títulos normales)
+Ejercicio = namedtuple(
+    "Ejercicio", ["problema", "encabezado", "intervalo", "x0", "iniciales_secante", "raiz_id"]
+)
+
+
+def _np():
+    import numpy
+    return numpy
+
+
+_NUMEROS = (float, int)
+
+
+def funcion_dual(escalar, vectorial, descripcion=None):
+    """Une un núcleo escalar (`math`) y otro vectorial (NumPy) en una sola función.
+
+    Los números (float, int y escalares de NumPy) van al núcleo escalar; lo
+    demás, al vectorial. Si `math` falla (desbordamiento o fuera de dominio)
+    se usa el núcleo vectorial, que devuelve inf/nan como antes.
+    """
+    def funcion(x):
+        if type(x) is float or isinstance(x, _NUMEROS):
+            try:
+                return escalar(x)
+            except (OverflowError, ValueError):
+                pass
+        return vectorial(x)
+
+    funcion.escalar = escalar
+    funcion.vectorial = vectorial
+    funcion.__doc__ = descripcion
+    return funcion
+
+
+# --- 1. Definición de las Funciones y sus Derivadas ---
+
+f_exponencial = funcion_dual(
+    lambda x: x**3 - math.exp(0.8 * x) - 20,
+    lambda x: x**3 - _np().exp(0.8 * x) - 20,
+    "Función: f(x) = x^3 - exp(0.8x) - 20",
+)
+
+df_exponencial = funcion_dual(
+    lambda x: 3 * x**2 - 0.8 * math.exp(0.8 * x),
+    lambda x: 3 * x**2 - 0.8 * _np().exp(0.8 * x),
+    "Derivada: f'(x) = 3x^2 - 0.8 * exp(0.8x)",
+)
+
+d2f_exponencial = funcion_dual(
+    lambda x: 6 * x - 0.64 * math.exp(0.8 * x),
+    lambda x: 6 * x - 0.64 * _np().exp(0.8 * x),
+    "Segunda derivada: f''(x) = 6x - 0.64 * exp(0.8x)",
+)
+
+
+# Polinomio: no necesita math ni NumPy, la misma expresión sirve para ambos.
+# Se evalúa en forma de Horner (sin potencias); ver también `polinomios`.
+def f_cubica(x):
+    """Función: f(x) = x^3 - 0.5x^2 + 4x - 1"""
+    return ((x - 0.5) * x + 4) * x - 1
+
+def df_cubica(x):
+    """Derivada: f'(x) = 3x^2 - x + 4"""
+    return (3 * x - 1) * x + 4
+
+def d2f_cubica(x):
+    """Segunda derivada: f''(x) = 6x - 1"""
+    return 6 * x - 1
+
+
+def _df_coseno_vectorial(x):
+    np = _np()
+    return np.cos(x) - x * np.sin(x)
+
+def _d2f_coseno_vectorial(x):
+    np = _np()
+    return -2 * np.sin(x) - x * np.cos(x)
+
+f_coseno = funcion_dual(
+    lambda x: x * math.cos(x),
+    lambda x: x * _np().cos(x),
+    "Función: f(x) = x * cos(x) (x en radianes)",
+)
+
+df_coseno = funcion_dual(
+    lambda x: math.cos(x) - x * math.sin(x),
+    _df_coseno_vectorial,
+    "Derivada: f'(x) = cos(x) - x * sin(x) (Regla del Producto)",
+)
+
+d2f_coseno = funcion_dual(
+    lambda x: -2 * math.sin(x) - x * math.cos(x),
+    _d2f_coseno_vectorial,
+    "Segunda derivada: f''(x) = -2 sin(x) - x * cos(x)",
+)
+
+
+EXPONENCIAL = Problema("exponencial", "x^3 - exp(0.8x) - 20", f_exponencial, df_exponencial)
+CUBICA = Problema("cubica", "x^3 - 0.5x^2 + 4x - 1", f_cubica, df_cubica)
+COSENO = Problema("coseno", "x * cos(x)", f_coseno, df_coseno)
+
+PROBLEMAS = {p.nombre: p for p in (EXPONENCIAL, CUBICA, COSENO)}
+
+# f'' a mano, para Halley (sin ella se usan duales anidados)
+SEGUNDAS_DERIVADAS = {
+    EXPONENCIAL.nombre: d2f_exponencial,
+    CUBICA.nombre: d2f_cubica,
+    COSENO.nombre: d2f_coseno,
+}
+
+# --- 2. Ejercicios ---
+
+_ENCABEZADO_EXPONENCIAL = (
+    "\n--- SOLUCIONES PARA f(x) = x^3 - exp(0.8x) - 20 ---\n"
+    "\n# Búsqueda de la Primera Raíz (x1)"
+)
+
+EJERCICIOS = {
+    1: Ejercicio(EXPONENCIAL, _ENCABEZADO_EXPONENCIAL, (3.0, 4.0), 3.5, (3.0, 4.0), 1),
+    2: Ejercicio(EXPONENCIAL, _ENCABEZADO_EXPONENCIAL, (3.0, 4.0), 3.5, (3.0, 4.0), 1),
+    3: Ejercicio(CUBICA, "--- PROBLEMA: f(x) = x^3 - 0.5x^2 + 4x - 1 ---", (0, 1), 0.2, (0.3, 0.2), None),
+    4: Ejercicio(COSENO, "--- PROBLEMA: f(x) = x * cos(x) ---", (1.5, 2.0), 1.5, (1.5, 2.0), None),
+}
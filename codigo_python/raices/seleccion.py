@@ -0,0 +1,198 @@
+"""Elección automática del método: `resolver(f, ...)` (alias `solve`).
+
+Los métodos candidatos dependen de lo que se tenga: con intervalo, Brent
+(seguro) y los métodos abiertos desde sus extremos; con derivada, Newton
+primero; sin ninguna de las dos, la secante (una evaluación de f por paso).
+
+Además se recuerda, por firma del problema, cuánto costó cada método. Las
+primeras veces que aparece una firma se prueba un candidato distinto en cada
+llamada; después se usa siempre el que terminó con menos evaluaciones (o en
+menos tiempo). El historial tiene tamaño acotado y descarta las firmas usadas
+hace más tiempo. Sin df, Newton y Halley evalúan f con números duales, que
+cuestan más que una evaluación normal: para compararlos con la secante
+conviene criterio="tiempo".
+
+La firma es la ecuación normalizada si `f` es texto, o el código de la
+función si es invocable: las funciones de una misma familia (p. ej. lambdas
+que solo cambian una constante capturada) comparten la firma. De las
+funciones de `problemas.funcion_dual` se usa el código del núcleo escalar
+(todas comparten el de la función que las une). Los envoltorios sin código
+propio (`instrumentar`, `memorizar`, `functools.partial`) se identifican por
+el objeto: cada envoltorio tiene su propia firma.
+"""
+
+from collections import OrderedDict
+
+from .convenciones import CONVERGIDO, RAIZ_EXACTA, TOL
+from .instrumentacion import medir
+from .metodos import (
+    _segundo_inicial,
+    brent,
+    halley,
+    newton_modificado,
+    newton_raphson,
+    secante,
+)
+
+# Firmas que se recuerdan
+TAM_HISTORIAL = 1024
+
+CRITERIOS = ("evaluaciones", "tiempo")
+
+
+def _brent(f, df, x0, intervalo, tol):
+    return medir(brent, f, *intervalo, tol, mostrar=False)
+
+
+def _newton(f, df, x0, intervalo, tol):
+    if df is None:
+        return medir(newton_raphson, f, None, x0, tol, mostrar=False)
+    return medir(newton_raphson, f, x0, tol, df=df, mostrar=False)
+
+
+def _newton_modificado(f, df, x0, intervalo, tol):
+    if df is None:
+        return medir(newton_modificado, f, None, x0, tol, mostrar=False)
+    return medir(newton_modificado, f, x0, tol, df=df, mostrar=False)
+
+
+def _halley(f, df, x0, intervalo, tol):
+    return medir(halley, f, None, None, x0, tol, mostrar=False)
+
+
+def _secante(f, df, x0, intervalo, tol):
+    iniciales = intervalo if intervalo is not None else (_segundo_inicial(x0), x0)
+    return medir(secante, f, *iniciales, tol, mostrar=False)
+
+
+METODOS = {
+    "brent": _brent,
+    "newton": _newton,
+    "halley": _halley,
+    "secante": _secante,
+    "newton_modificado": _newton_modificado,
+}
+
+# --- 1. Historial ---
+
+class Historial:
+    """Costo de cada método por firma de problema (LRU de `tam` firmas).
+
+    Para cada firma guarda {método: (evaluaciones, tiempo)} de la última vez
+    que se usó; un fallo se guarda con costo infinito.
+    """
+
+    def __init__(self, tam=TAM_HISTORIAL):
+        self.tam = tam
+        self._firmas = OrderedDict()
+
+    def costos(self, firma):
+        costos = self._firmas.get(firma)
+        if costos is not None:
+            self._firmas.move_to_end(firma)
+        return costos or {}
+
+    def registrar(self, firma, metodo, evaluaciones, tiempo):
+        costos = self._firmas.setdefault(firma, {})
+        self._firmas.move_to_end(firma)
+        costos[metodo] = (evaluaciones, tiempo)
+        while len(self._firmas) > self.tam:
+            self._firmas.popitem(last=False)
+
+    def elegir(self, firma, candidatos, criterio="evaluaciones"):
+        """El primer candidato sin probar o, si ya se probaron todos, el de menor costo."""
+        costos = self.costos(firma)
+        for metodo in candidatos:
+            if metodo not in costos:
+                return metodo
+        indice = 0 if criterio == "evaluaciones" else 1
+        return min(candidatos, key=lambda m: (costos[m][indice], costos[m][1 - indice]))
+
+    def limpiar(self):
+        self._firmas.clear()
+
+    def __len__(self):
+        return len(self._firmas)
+
+
+HISTORIAL = Historial()
+
+# --- 2. Candidatos y firma ---
+
+def candidatos(intervalo=None, x0=None, df=None, costo_df=None):
+    """Métodos aplicables, en el orden de preferencia inicial.
+
+    `costo_df` es el costo de evaluar df relativo a f (si se conoce): si df
+    cuesta más que f, la secante (que no la usa) va antes que Newton.
+    """
+    abiertos = ["newton", "secante"] if df is not None else ["secante", "newton", "halley"]
+    if df is not None and costo_df is not None and costo_df > 1:
+        abiertos = ["secante", "newton"]
+    # Para raíces múltiples, donde los demás convergen lentamente o fallan
+    abiertos.append("newton_modificado")
+    if intervalo is not None:
+        return ["brent"] + abiertos
+    if x0 is None:
+        raise ValueError("Se necesita un intervalo [a, b] o un valor inicial x0.")
+    return abiertos
+
+
+def firma(f, intervalo=None, x0=None, df=None):
+    """Firma del problema para el historial: la ecuación y qué datos se tienen."""
+    if isinstance(f, str):
+        from .expresiones import compilar
+        clave = compilar(f).texto
+    else:
+        # Las funciones de `funcion_dual` solo se distinguen por su núcleo
+        nucleo = getattr(f, "escalar", f)
+        clave = getattr(nucleo, "__code__", nucleo)
+    return (clave, intervalo is not None, x0 is not None, df is not None)
+
+# --- 3. Resolución ---
+
+def _exitoso(resultado):
+    return resultado.estado in (CONVERGIDO, RAIZ_EXACTA)
+
+
+def resolver(f, intervalo=None, x0=None, df=None, tol=TOL, criterio="evaluaciones",
+             costo_df=None, historial=HISTORIAL):
+    """Resuelve f(x) = 0 eligiendo el método; devuelve el `Resultado` del método usado.
+
+    `f` puede ser una función o una ecuación en texto ("x**3 - exp(0.8*x) - 20").
+    Si el método elegido no converge se prueban los demás candidatos en orden.
+    """
+    if criterio not in CRITERIOS:
+        raise ValueError(f"Criterio desconocido {criterio!r}; use uno de {CRITERIOS}.")
+
+    clave = firma(f, intervalo, x0, df)
+    if isinstance(f, str):
+        from .expresiones import compilar
+        expresion = compilar(f)
+        f, df = expresion.f, df or expresion.df
+    if x0 is None and intervalo is not None:
+        x0 = (intervalo[0] + intervalo[1]) / 2
+
+    opciones = candidatos(intervalo, x0, df, costo_df)
+    elegido = historial.elegir(clave, opciones, criterio)
+    orden = [elegido] + [m for m in opciones if m != elegido]
+
+    resultado = error = None
+    for metodo in orden:
+        try:
+            resultado, costo = METODOS[metodo](f, df, x0, intervalo, tol)
+        except (TypeError, ArithmeticError) as excepcion:
+            # p. ej. f usa math.exp y no acepta los duales de Newton sin df
+            historial.registrar(clave, metodo, float("inf"), float("inf"))
+            error = excepcion
+            continue
+        if _exitoso(resultado):
+            historial.registrar(clave, metodo, costo.evaluaciones, costo.tiempo_total)
+            return resultado
+        historial.registrar(clave, metodo, float("inf"), float("inf"))
+
+    if resultado is None:
+        raise error
+    return resultado
+
+
+solve = resolver
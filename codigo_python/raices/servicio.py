@@ -0,0 +1,177 @@
+"""Servicio local que agrupa solicitudes sueltas en lotes (asyncio, JSON Lines).
+
+Cada solicitud es una línea JSON con las mismas claves que las filas de
+`ejecutor` (ecuacion, metodo, a, b, x0, tol, id) y cada respuesta es una línea
+con id, raiz, iteraciones y estado (o id y error). Las solicitudes de la
+misma ecuación (normalizada) y método que llegan dentro de una ventana corta
+se resuelven juntas con el método vectorizado: el lote se despacha cuando
+junta `tam_lote` solicitudes o cuando la primera lleva `espera` segundos
+esperando, lo que ocurra primero. Las respuestas de una conexión pueden
+llegar en otro orden que las solicitudes; se asocian por `id`.
+
+Uso (desde codigo_python/):
+    python -m raices.servicio --unix /tmp/raices.sock
+    python -m raices.servicio --puerto 8765 --tam-lote 4096 --espera-ms 1
+"""
+
+import argparse
+import asyncio
+import json
+
+import numpy as np
+
+from .ejecutor import _COLUMNAS, _resolver_tramo, preparar
+from .expresiones import compilar
+
+# Máximo de solicitudes por lote
+TAM_LOTE = 1024
+
+# Segundos que la primera solicitud de un lote espera a que lleguen más
+ESPERA = 0.002
+
+# Largo máximo de una línea de solicitud
+LIMITE_LINEA = 1 << 16
+
+
+class Servicio:
+    """Agrupa solicitudes por (ecuación, método) y las resuelve por lotes."""
+
+    def __init__(self, tam_lote=TAM_LOTE, espera=ESPERA):
+        self.tam_lote = tam_lote
+        self.espera = espera
+        self._pendientes = {}   # clave -> [(fila, futuro)]
+        self._temporizadores = {}
+        self._lotes_en_curso = set()   # referencias: el bucle solo guarda referencias débiles
+        self.lotes = 0
+        self.solicitudes = 0
+
+    async def resolver(self, fila):
+        """Encola una solicitud (diccionario) y espera su respuesta (diccionario)."""
+        identificador = fila.get("id")
+        try:
+            _, ecuaciones, metodos, _ = preparar([fila])
+            clave = (compilar(ecuaciones[0]).texto, metodos[0])
+        except (KeyError, TypeError, ValueError, AttributeError) as error:
+            return {"id": identificador, "error": str(error)}
+
+        futuro = asyncio.get_running_loop().create_future()
+        grupo = self._pendientes.setdefault(clave, [])
+        grupo.append((fila, futuro))
+        if len(grupo) >= self.tam_lote:
+            self._despachar(clave)
+        elif len(grupo) == 1:
+            self._temporizadores[clave] = asyncio.get_running_loop().call_later(
+                self.espera, self._despachar, clave
+            )
+        return await futuro
+
+    def _despachar(self, clave):
+        temporizador = self._temporizadores.pop(clave, None)
+        if temporizador is not None:
+            temporizador.cancel()
+        grupo = self._pendientes.pop(clave, None)
+        if grupo:
+            self.lotes += 1
+            self.solicitudes += len(grupo)
+            tarea = asyncio.get_running_loop().create_task(self._resolver_lote(clave, grupo))
+            self._lotes_en_curso.add(tarea)
+            tarea.add_done_callback(self._lotes_en_curso.discard)
+
+    async def _resolver_lote(self, clave, grupo):
+        filas = [fila for fila, _ in grupo]
+        try:
+            # Fuera del hilo del bucle, para seguir recibiendo mientras se calcula
+            respuestas = await asyncio.get_running_loop().run_in_executor(
+                None, _resolver_filas, filas, *clave
+            )
+        except Exception as error:  # El error de un lote se informa a cada solicitud
+            respuestas = [{"id": fila.get("id"), "error": str(error)} for fila in filas]
+        for (_, futuro), respuesta in zip(grupo, respuestas):
+            if not futuro.done():
+                futuro.set_result(respuesta)
+
+    async def atender(self, lector, escritor):
+        """Atiende una conexión: una solicitud por línea, una respuesta por línea."""
+        tareas = set()
+        try:
+            while linea := await lector.readline():
+                if linea.strip():
+                    tarea = asyncio.create_task(self._responder(linea, escritor))
+                    tareas.add(tarea)
+                    tarea.add_done_callback(tareas.discard)
+            if tareas:
+                await asyncio.gather(*tareas)
+        finally:
+            escritor.close()
+
+    async def _responder(self, linea, escritor):
+        try:
+            fila = json.loads(linea)
+            if not isinstance(fila, dict):
+                raise ValueError("La solicitud debe ser un objeto JSON.")
+        except ValueError as error:
+            respuesta = {"id": None, "error": str(error)}
+        else:
+            respuesta = await self.resolver(fila)
+        escritor.write((json.dumps(respuesta) + "\n").encode())
+        await escritor.drain()
+
+
+def _resolver_filas(filas, ecuacion, metodo):
+    """Resuelve un lote de filas de la misma ecuación y método; devuelve las respuestas."""
+    _, _, _, entrada = preparar(filas)
+    ids = [fila.get("id") for fila in filas]
+    n = len(filas)
+    vistas = {"entrada": entrada}
+    for nombre, (dtype, _) in _COLUMNAS.items():
+        if nombre != "entrada":
+            vistas[nombre] = np.empty(n, dtype=dtype)
+    _resolver_tramo(vistas, 0, n, ecuacion, metodo)
+
+    return [
+        {
+            "id": ids[i],
+            "raiz": None if np.isnan(raiz) else raiz,
+            "iteraciones": iteraciones,
+            "estado": estado,
+        }
+        for i, (raiz, iteraciones, estado) in enumerate(zip(
+            vistas["raiz"].tolist(), vistas["iteraciones"].tolist(), vistas["estado"].tolist()
+        ))
+    ]
+
+
+async def servir(servicio, unix=None, host="127.0.0.1", puerto=8765):
+    """Atiende conexiones hasta que se cancele la tarea."""
+    if unix is not None:
+        servidor = await asyncio.start_unix_server(servicio.atender, path=unix, limit=LIMITE_LINEA)
+    else:
+        servidor = await asyncio.start_server(servicio.atender, host, puerto, limit=LIMITE_LINEA)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m raices.servicio",
+        description="Servicio local de resolución por lotes (JSON Lines sobre un socket).",
+    )
+    parser.add_argument("--unix", help="ruta del socket Unix (si no se da, se usa TCP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--tam-lote", type=int, default=TAM_LOTE,
+                        help=f"máximo de solicitudes por lote (por defecto {TAM_LOTE})")
+    parser.add_argument("--espera-ms", type=float, default=ESPERA * 1000,
+                        help=f"espera máxima para juntar un lote (por defecto {ESPERA * 1000:g} ms)")
+    args = parser.parse_args(argv)
+
+    servicio = Servicio(args.tam_lote, args.espera_ms / 1000)
+    try:
+        asyncio.run(servir(servicio, args.unix, args.host, args.puerto))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,303 @@
+"""Sustituto precalculado de la raíz de una familia f(x, c) = 0: consultas en O(1).
+
+Para consultas repetidas de la raíz de x^3 - exp(0.8x) - c (ejer1/ejer2 con
+c en lugar de 20) con c arbitrario, incluso un Newton en caliente por
+consulta es caro. Aquí la curva x(c) se tabula una vez:
+
+- Construcción (fuera de línea): el rango [c_min, c_max] se divide en tramos
+  adaptativos. En cada tramo se resuelve la familia en los nodos de
+  Chebyshev (con `barrido.barrer`) y se guarda el interpolante de grado
+  `grado`. Si el error medido contra raíces resueltas en puntos de control
+  (entre los nodos) supera `tol`, el tramo se parte en dos.
+- Consulta: búsqueda del tramo, Clenshaw (unas decenas de operaciones) y,
+  opcionalmente, un paso de Newton de pulido. Fuera del rango tabulado se
+  resuelve con `barrer` desde la raíz del extremo más cercano.
+
+Cota de error de cada consulta:
+
+- Sin pulir: el error de interpolación medido en la construcción, por un
+  factor de seguridad (FACTOR_SEGURIDAD).
+- Con pulido: e0 = min(cota sin pulir, |f(x)| / m1) y, tras el paso de
+  Newton, M2 * e0^2 / (2 |f_x(x)|), donde m1 y M2 acotan |f_x| por debajo y
+  |f_xx| por arriba en una banda alrededor de la curva del tramo.
+
+m1 y M2 se estiman por muestreo en la construcción (con un margen), no con
+aritmética de intervalos: la cota vale mientras f no tenga detalles más
+finos que los puntos de control. Cerca de un pliegue (f_x -> 0) la cota
+crece y la interpolación necesita muchos tramos; el rango debe quedar sobre
+una sola rama de la curva.
+
+El sustituto se guarda en un .npz pequeño (unos KB). Como f no se puede
+guardar, se pasa de nuevo al cargar; se comprueba que tenga el mismo nombre.
+
+Uso (desde codigo_python/):
+    python -m raices.sustituto sustituto.npz --rango 0 80 --x0 1.5
+"""
+
+import argparse
+import math
+from bisect import bisect_right
+from collections import namedtuple
+
+import numpy as np
+
+from .barrido import barrer
+from .convenciones import CONVERGIDO, EPS_DIVISION, MAX_ITERACIONES, TOL
+from .dual import exp, valor_y_derivada, valor_y_derivadas
+
+# cota: cota del error |raiz - x*(c)|; nan fuera del rango tabulado
+# tabulado: False si se resolvió con `barrer` por estar fuera del rango
+Consulta = namedtuple("Consulta", ["raiz", "cota", "estado", "tabulado"])
+
+# Respuesta para c nan o infinito (como los métodos por lotes con datos nan)
+_SIN_RAIZ = Consulta(math.nan, math.nan, MAX_ITERACIONES, False)
+
+GRADO = 16
+
+# Error de interpolación buscado en cada tramo
+TOL_SUSTITUTO = 1e-10
+
+# Tolerancia de Newton para las raíces de los nodos y puntos de control
+TOL_NODOS = 1e-13
+
+# La cota guardada es el error medido por este factor
+FACTOR_SEGURIDAD = 4
+
+# Máximo de tramos (limita el tamaño del archivo cerca de un pliegue)
+MAX_TRAMOS = 4096
+
+_EPS = float(np.finfo(float).eps)
+
+
+def familia_exponencial(x, c):
+    """f(x, c) = x^3 - exp(0.8x) - c"""
+    return x**3 - exp(0.8 * x) - c
+
+# --- 1. Interpolación de Chebyshev ---
+
+def _nodos(grado):
+    """Nodos de Chebyshev de primera especie en [-1, 1] (ángulos y puntos)."""
+    theta = np.pi * (np.arange(grado + 1) + 0.5) / (grado + 1)
+    return theta, np.cos(theta)
+
+
+def _coeficientes(theta, valores):
+    grado = valores.size - 1
+    k = np.arange(grado + 1)
+    coef = 2 / (grado + 1) * np.cos(np.outer(k, theta)) @ valores
+    coef[0] /= 2
+    return coef
+
+
+def _clenshaw(coef, t):
+    """Suma de coef[k] * T_k(t); t puede ser un número o un arreglo (con coef por fila)."""
+    b1 = b2 = 0.0
+    t2 = 2 * t
+    for a_k in coef[:0:-1]:
+        b1, b2 = a_k + t2 * b1 - b2, b1
+    return coef[0] + t * b1 - b2
+
+
+def _local(c, a, b):
+    return (2 * c - a - b) / (b - a)
+
+# --- 2. Construcción ---
+
+def _resolver(f, parametros, x0):
+    resultado = barrer(f, parametros, x0, "newton", TOL_NODOS)
+    fallidos = resultado.estado != CONVERGIDO
+    if fallidos.any():
+        c = resultado.parametros[np.argmax(fallidos)]
+        raise ValueError(f"La familia no converge en c = {c!r}; revise el rango o x0.")
+    return resultado.raiz
+
+
+def _derivadas_en_banda(f, parametros, raices, ancho):
+    """(min |f_x|, max |f_xx|) muestreados en x*(c) y x*(c) +- ancho."""
+    m1, m2 = math.inf, 0.0
+    for c, raiz in zip(parametros.tolist(), raices.tolist()):
+        for x in (raiz - ancho, raiz, raiz + ancho):
+            _, f_x, f_xx = valor_y_derivadas(lambda x: f(x, c), x)
+            m1 = min(m1, abs(f_x))
+            m2 = max(m2, abs(f_xx))
+    return m1, m2
+
+
+def _tramo(f, a, b, x0, theta, t, control):
+    """Interpola x(c) en [a, b]: (coeficientes, error medido, raíces de control)."""
+    centro, radio = (a + b) / 2, (b - a) / 2
+    coef = _coeficientes(theta, _resolver(f, centro + radio * t, x0))
+    c_control = centro + radio * control
+    raices_control = _resolver(f, c_control, x0)
+    error = np.max(np.abs(_clenshaw(coef, control) - raices_control))
+    return coef, float(error), c_control, raices_control
+
+
+def construir(f, c_min, c_max, x0, grado=GRADO, tol=TOL_SUSTITUTO, max_tramos=MAX_TRAMOS):
+    """Tabula la raíz de f(x, c) = 0 para c en [c_min, c_max].
+
+    `x0` es un valor inicial para c_min; el resto de la curva se sigue por
+    continuación. f debe aceptar números duales (como `familia_exponencial`).
+    """
+    if not c_min < c_max:
+        raise ValueError("Se requiere c_min < c_max.")
+
+    theta, t = _nodos(grado)
+    # Puntos de control: los extremos y los puntos medios (en ángulo) entre nodos
+    control = np.cos(np.pi * np.arange(grado + 2) / (grado + 1))[::-1]
+
+    cortes, coeficientes, errores, m1s, m2s = [c_min], [], [], [], []
+    pendientes = [(c_min, c_max)]  # pila; se procesa de izquierda a derecha
+    x_semilla = float(x0)
+    while pendientes:
+        a, b = pendientes.pop()
+        coef, error, c_control, raices_control = _tramo(f, a, b, x_semilla, theta, t, control)
+        if error > tol and len(cortes) + len(pendientes) < max_tramos:
+            medio = (a + b) / 2
+            pendientes += [(medio, b), (a, medio)]
+            continue
+
+        cota = FACTOR_SEGURIDAD * error + 4 * _EPS * float(np.max(np.abs(raices_control)))
+        m1, m2 = _derivadas_en_banda(f, c_control, raices_control, cota)
+        cortes.append(b)
+        coeficientes.append(coef)
+        errores.append(cota)
+        m1s.append(m1 / 2)
+        m2s.append(m2 * 2)
+        x_semilla = float(raices_control[-1])
+
+    return Sustituto(
+        f, np.array(cortes), np.array(coeficientes), np.array(errores),
+        np.array(m1s), np.array(m2s),
+    )
+
+# --- 3. Consulta ---
+
+class Sustituto:
+    """Interpolante por tramos de x(c); se obtiene con `construir` o `cargar`."""
+
+    def __init__(self, f, cortes, coeficientes, errores, m1, m2):
+        self.f = f
+        self.cortes = cortes
+        self.coeficientes = coeficientes
+        self.errores = errores
+        self.m1 = m1
+        self.m2 = m2
+        # Copias en listas: en consultas sueltas son más rápidas que NumPy
+        self._cortes = cortes.tolist()
+        self._coeficientes = coeficientes.tolist()
+        self._errores = errores.tolist()
+        self._m1 = m1.tolist()
+        self._m2 = m2.tolist()
+
+    @property
+    def rango(self):
+        return self._cortes[0], self._cortes[-1]
+
+    def __len__(self):
+        return len(self._coeficientes)
+
+    def consultar(self, c, pulir=False):
+        """Raíz de f(x, c) = 0 y su cota de error, como `Consulta`."""
+        c = float(c)
+        if not math.isfinite(c):
+            return _SIN_RAIZ
+        cortes = self._cortes
+        if not cortes[0] <= c <= cortes[-1]:
+            return self._fuera_de_rango(c)
+
+        i = min(bisect_right(cortes, c) - 1, len(self._coeficientes) - 1)
+        x = _clenshaw(self._coeficientes[i], _local(c, cortes[i], cortes[i + 1]))
+        cota = self._errores[i]
+        if not pulir:
+            return Consulta(x, cota, CONVERGIDO, True)
+
+        f = self.f
+        fx, dfx = valor_y_derivada(lambda x: f(x, c), x)
+        if abs(dfx) < EPS_DIVISION:
+            return Consulta(x, cota, CONVERGIDO, True)
+        x_nuevo = x - fx / dfx
+        m1 = self._m1[i]
+        e0 = min(cota, abs(fx) / m1) if m1 > 0 else cota
+        cota_nueva = self._m2[i] * e0 * e0 / (2 * abs(dfx)) + 4 * _EPS * abs(x_nuevo)
+        return Consulta(x_nuevo, min(cota, cota_nueva), CONVERGIDO, True)
+
+    def consultar_lote(self, c, pulir=False):
+        """Como `consultar` para un arreglo de c; devuelve una `Consulta` de arreglos."""
+        c = np.asarray(c, dtype=float)
+        forma = c.shape
+        c = c.ravel()
+        c_min, c_max = self.rango
+        dentro = (c >= c_min) & (c <= c_max)
+        # Los c de afuera (o nan) se reemplazan después; aquí se evalúan en c_min
+        c_tabla = np.where(dentro, c, c_min)
+
+        i = np.clip(np.searchsorted(self.cortes, c_tabla, side="right") - 1, 0, len(self) - 1)
+        t = _local(c_tabla, self.cortes[i], self.cortes[i + 1])
+        x = _clenshaw(self.coeficientes[i].T, t)
+        cota = self.errores[i]
+
+        if pulir:
+            with np.errstate(all="ignore"):
+                fx, dfx = valor_y_derivada(lambda x: self.f(x, c_tabla), x)
+                util = np.abs(dfx) >= EPS_DIVISION
+                x_nuevo = x - fx / dfx
+                e0 = np.fmin(cota, np.abs(fx) / self.m1[i])
+                cota_nueva = self.m2[i] * e0 * e0 / (2 * np.abs(dfx)) + 4 * _EPS * np.abs(x_nuevo)
+            x = np.where(util, x_nuevo, x)
+            cota = np.where(util, np.minimum(cota, cota_nueva), cota)
+
+        estado = np.full(c.size, CONVERGIDO, dtype=np.int8)
+        for k in np.flatnonzero(~dentro):
+            consulta = self._fuera_de_rango(float(c[k])) if np.isfinite(c[k]) else _SIN_RAIZ
+            x[k], cota[k], estado[k], _ = consulta
+        return Consulta(x.reshape(forma), cota.reshape(forma), estado.reshape(forma),
+                        dentro.reshape(forma))
+
+    def _fuera_de_rango(self, c):
+        # Resolución completa desde la raíz tabulada del extremo más cercano
+        c_min, c_max = self.rango
+        x0 = self.consultar(min(max(c, c_min), c_max)).raiz
+        resultado = barrer(self.f, [c], x0, "newton", TOL)
+        return Consulta(float(resultado.raiz[0]), math.nan, int(resultado.estado[0]), False)
+
+    def guardar(self, ruta):
+        np.savez(
+            ruta, cortes=self.cortes, coeficientes=self.coeficientes, errores=self.errores,
+            m1=self.m1, m2=self.m2, familia=np.array(self.f.__name__),
+        )
+
+
+def cargar(ruta, f=familia_exponencial):
+    """Lee un sustituto guardado con `Sustituto.guardar` para la familia `f`."""
+    with np.load(ruta) as datos:
+        familia = str(datos["familia"])
+        if familia != f.__name__:
+            raise ValueError(f"{ruta!r} es un sustituto de {familia!r}, no de {f.__name__!r}.")
+        return Sustituto(
+            f, datos["cortes"], datos["coeficientes"], datos["errores"], datos["m1"], datos["m2"]
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m raices.sustituto",
+        description="Tabula la raíz de x^3 - exp(0.8x) - c para c en un rango.",
+    )
+    parser.add_argument("archivo", help="archivo .npz de salida")
+    parser.add_argument("--rango", type=float, nargs=2, default=[0.0, 80.0],
+                        metavar=("C_MIN", "C_MAX"))
+    parser.add_argument("--x0", type=float, default=1.5, help="valor inicial para C_MIN")
+    parser.add_argument("--grado", type=int, default=GRADO)
+    parser.add_argument("--tol", type=float, default=TOL_SUSTITUTO,
+                        help=f"error de interpolación buscado (por defecto {TOL_SUSTITUTO})")
+    args = parser.parse_args(argv)
+
+    sustituto = construir(familia_exponencial, *args.rango, args.x0, args.grado, args.tol)
+    sustituto.guardar(args.archivo)
+    print(f"tramos: {len(sustituto)}  cota máxima sin pulir: {sustituto.errores.max():.2e}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
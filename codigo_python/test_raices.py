@@ -0,0 +1,267 @@
+"""Pruebas de las garantías del paquete `raices` (desde codigo_python/: python -m pytest)."""
+
+import asyncio
+import math
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from raices.barrido import barrer
+from raices.convenciones import CONVERGIDO, MAX_ITERACIONES, RAIZ_EXACTA, SIN_CAMBIO_SIGNO, TOL
+from raices.dual import valor_y_derivadas
+from raices.ejecutor import preparar
+from raices.exportar import EscritorHistorial
+from raices.expresiones import compilar
+from raices.lote import biseccion_lote, newton_lote, secante_lote
+from raices.metodos import (
+    iterar_biseccion,
+    iterar_brent,
+    iterar_newton,
+    iterar_newton_modificado,
+    iterar_secante,
+    iterar_steffensen,
+    resultado_final,
+)
+from raices.problemas import COSENO, EJERCICIOS, EXPONENCIAL, SEGUNDAS_DERIVADAS
+from raices.seleccion import Historial, firma, resolver
+from raices.servicio import Servicio
+from raices.sustituto import construir, familia_exponencial
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+CARRILES = 200
+
+
+def _escalar(iteraciones):
+    return resultado_final(iteraciones)
+
+
+def _comparar(lote, escalares):
+    """Cada carril del lote debe dar lo mismo que la versión escalar.
+
+    Las raíces pueden diferir en unos ulp: el escalar usa `math.exp` y el
+    lote `np.exp`, que no siempre redondean igual.
+    """
+    for k, esperado in enumerate(escalares):
+        assert lote.estado[k] == esperado.estado
+        assert lote.iteraciones[k] == esperado.iteraciones
+        if esperado.raiz is None:
+            assert np.isnan(lote.raiz[k])
+        else:
+            assert lote.raiz[k] == pytest.approx(esperado.raiz, rel=1e-13, abs=1e-15)
+
+# --- 1. Lotes contra la versión escalar ---
+
+@pytest.mark.parametrize("numero", sorted(EJERCICIOS))
+def test_biseccion_lote_igual_a_escalar(numero):
+    ejercicio = EJERCICIOS[numero]
+    f = ejercicio.problema.f
+    rng = np.random.default_rng(numero)
+    a0, b0 = ejercicio.intervalo
+    a = a0 - rng.uniform(0, 0.5, CARRILES)
+    b = b0 + rng.uniform(-0.2, 0.5, CARRILES)
+
+    lote = biseccion_lote(f, a, b, TOL)
+    _comparar(lote, [
+        _escalar(iterar_biseccion(f, float(a[k]), float(b[k]), TOL, registrar=False))
+        for k in range(CARRILES)
+    ])
+
+
+@pytest.mark.parametrize("numero", sorted(EJERCICIOS))
+def test_newton_lote_igual_a_escalar(numero):
+    ejercicio = EJERCICIOS[numero]
+    problema = ejercicio.problema
+    x0 = ejercicio.x0 + np.random.default_rng(numero).uniform(-0.5, 0.5, CARRILES)
+
+    lote = newton_lote(problema.f, problema.df, x0, TOL)
+    _comparar(lote, [
+        _escalar(iterar_newton(problema.f, problema.df, float(x0[k]), TOL, registrar=False))
+        for k in range(CARRILES)
+    ])
+
+
+@pytest.mark.parametrize("numero", sorted(EJERCICIOS))
+def test_secante_lote_igual_a_escalar(numero):
+    ejercicio = EJERCICIOS[numero]
+    f = ejercicio.problema.f
+    desplazamiento = np.random.default_rng(numero).uniform(-0.3, 0.3, CARRILES)
+    x_menos_1, x0 = (np.array(ejercicio.iniciales_secante) + desplazamiento[:, None]).T
+
+    lote = secante_lote(f, x_menos_1, x0, TOL)
+    _comparar(lote, [
+        _escalar(iterar_secante(f, float(x_menos_1[k]), float(x0[k]), TOL, registrar=False))
+        for k in range(CARRILES)
+    ])
+
+# --- 2. Brent nunca usa más iteraciones que la bisección ---
+
+def _problemas_brent():
+    rng = np.random.default_rng(0)
+    casos = [(lambda x: (x - 1) ** 3, 0.0, 3.0)]
+    for _ in range(100):
+        raiz = rng.uniform(-2, 2)
+        a, b = raiz - rng.uniform(0.1, 3), raiz + rng.uniform(0.1, 3)
+        casos.append((lambda x, r=raiz: (x - r) ** 3, a, b))
+        casos.append((lambda x, r=raiz: math.exp(x - r) - 1, a, b))
+    return casos
+
+
+@pytest.mark.parametrize("tol", [1e-4, 1e-8, 1e-12])
+def test_brent_no_supera_a_la_biseccion(tol):
+    for f, a, b in _problemas_brent():
+        brent = _escalar(iterar_brent(f, a, b, tol, registrar=False))
+        biseccion = _escalar(iterar_biseccion(f, a, b, tol, registrar=False))
+        assert brent.estado in (CONVERGIDO, RAIZ_EXACTA)
+        assert brent.iteraciones <= biseccion.iteraciones
+
+
+def test_brent_en_raiz_triple():
+    brent = _escalar(iterar_brent(lambda x: (x - 1) ** 3, 0.0, 3.0, 1e-8, registrar=False))
+    assert brent.estado == CONVERGIDO
+    assert brent.iteraciones == 29
+    assert abs(brent.raiz - 1) < 1e-8
+
+# --- 3. La línea de comandos reproduce ejer1.py - ejer4.py ---
+
+def _salida(*argumentos):
+    return subprocess.run(
+        [sys.executable, *argumentos], cwd=DIRECTORIO, capture_output=True, check=True
+    ).stdout
+
+
+@pytest.mark.parametrize("numero", sorted(EJERCICIOS))
+def test_cli_igual_a_los_ejercicios(numero):
+    assert _salida("-m", "raices", str(numero)) == _salida(f"ejer{numero}.py")
+
+# --- 4. Servicio ---
+
+def _solicitudes():
+    rng = np.random.default_rng(0)
+    filas = []
+    for k in range(60):
+        filas.append({"id": f"n{k}", "ecuacion": "x^3 - exp(0.8*x) - 20", "metodo": "newton",
+                      "x0": rng.uniform(3.0, 4.0)})
+        filas.append({"id": f"b{k}", "ecuacion": "x^3 - 0.5*x^2 + 4*x - 1", "metodo": "biseccion",
+                      "a": rng.uniform(-1, 0.2), "b": rng.uniform(0.3, 1)})
+        filas.append({"id": f"s{k}", "ecuacion": "x * cos(x)", "metodo": "secante",
+                      "a": rng.uniform(1.4, 1.5), "b": rng.uniform(1.6, 1.7)})
+    return filas
+
+
+def _resolver_escalar(fila):
+    expresion = compilar(fila["ecuacion"])
+    if fila["metodo"] == "newton":
+        return _escalar(iterar_newton(expresion.f, expresion.df, fila["x0"], registrar=False))
+    if fila["metodo"] == "secante":
+        return _escalar(iterar_secante(expresion.f, fila["a"], fila["b"], registrar=False))
+    return _escalar(iterar_biseccion(expresion.f, fila["a"], fila["b"], registrar=False))
+
+
+def _atender(filas, tam_lote=16):
+    async def todas():
+        servicio = Servicio(tam_lote, 0.001)
+        return await asyncio.gather(*(servicio.resolver(fila) for fila in filas))
+    return asyncio.run(todas())
+
+
+def test_servicio_igual_a_escalar():
+    filas = _solicitudes()
+    for fila, respuesta in zip(filas, _atender(filas)):
+        esperado = _resolver_escalar(fila)
+        assert respuesta["id"] == fila["id"]
+        assert respuesta["estado"] == esperado.estado
+        assert abs(respuesta["raiz"] - esperado.raiz) < TOL
+
+
+def test_servicio_rechaza_datos_faltantes():
+    respuesta, = _atender([{"ecuacion": "x^2-2", "metodo": "newton"}])
+    assert "error" in respuesta and "x0" in respuesta["error"]
+
+
+@pytest.mark.parametrize("fila, clave", [
+    ({"ecuacion": "x^2-2", "metodo": "newton", "x0": ""}, "x0"),
+    ({"ecuacion": "x^2-2", "metodo": "biseccion", "a": 1}, "b"),
+    ({"ecuacion": "x^2-2", "metodo": "secante", "b": 2}, "a"),
+])
+def test_preparar_exige_los_datos_iniciales(fila, clave):
+    with pytest.raises(ValueError, match=f"Fila 0: falta '{clave}'"):
+        preparar([fila])
+
+
+def test_preparar_tol_opcional():
+    _, _, _, entrada = preparar([{"ecuacion": "x^2-2", "metodo": "newton", "x0": 1}])
+    assert entrada[2, 0] == TOL
+
+# --- 5. Regresiones ---
+
+@pytest.mark.parametrize("f, df, x0, raiz", [
+    (lambda x: (x - 1) ** 3 * (x + 2), lambda x: 3 * (x - 1) ** 2 * (x + 2) + (x - 1) ** 3, 2.0, 1.0),
+    (lambda x: (x - 1) ** 2 * (x + 5), lambda x: 2 * (x - 1) * (x + 5) + (x - 1) ** 2, 2.0, 1.0),
+])
+def test_newton_modificado_en_raices_multiples(f, df, x0, raiz):
+    modificado = _escalar(iterar_newton_modificado(f, df, x0, 1e-10, registrar=False))
+    newton = _escalar(iterar_newton(f, df, x0, 1e-10, registrar=False))
+    assert modificado.estado == CONVERGIDO
+    assert abs(modificado.raiz - raiz) < 1e-8
+    assert modificado.iteraciones < newton.iteraciones
+
+
+def test_exportar_nombre_de_metodo_completo(tmp_path):
+    with EscritorHistorial(str(tmp_path)) as escritor:
+        escritor.registrar(0, iterar_newton_modificado(lambda x: (x - 1) ** 3,
+                                                       lambda x: 3 * (x - 1) ** 2, 2.0))
+    resultados = np.load(tmp_path / "resultados.npy")
+    assert resultados["metodo"][0] == "newton_modificado"
+
+
+@pytest.mark.parametrize("numero", sorted(EJERCICIOS))
+def test_steffensen_converge_en_los_ejercicios(numero):
+    ejercicio = EJERCICIOS[numero]
+    resultado = _escalar(iterar_steffensen(ejercicio.problema.f, ejercicio.x0, registrar=False))
+    newton = _escalar(iterar_newton(ejercicio.problema.f, ejercicio.problema.df, ejercicio.x0,
+                                    registrar=False))
+    assert resultado.estado == CONVERGIDO
+    assert resultado.iteraciones <= 5
+    assert abs(resultado.raiz - newton.raiz) < TOL
+
+
+@pytest.mark.parametrize("problema", [EXPONENCIAL, COSENO], ids=lambda p: p.nombre)
+def test_segundas_derivadas(problema):
+    d2f = SEGUNDAS_DERIVADAS[problema.nombre]
+    for x in (0.3, 1.5, 3.5):
+        _, dfx, d2fx = valor_y_derivadas(problema.f, x)
+        assert dfx == pytest.approx(problema.df(x))
+        assert d2fx == pytest.approx(d2f(x))
+
+
+def test_firma_distingue_problemas():
+    assert firma(EXPONENCIAL.f, (3, 4)) != firma(COSENO.f, (1.5, 2))
+    assert firma(EXPONENCIAL.f, (3, 4)) == firma(EXPONENCIAL.f, (3.5, 4))
+
+    historial = Historial()
+    for _ in range(6):
+        resolver(EXPONENCIAL.f, (3.0, 4.0), historial=historial)
+    assert historial.costos(firma(COSENO.f, (1.5, 2.0))) == {}
+
+
+def test_barrido_no_acepta_raices_fuera_del_intervalo():
+    barrido = barrer(familia_exponencial, [20, 5, 40], 3.5, intervalo=(3, 4))
+    assert barrido.estado[0] == CONVERGIDO
+    assert abs(barrido.raiz[0] - 3.208220) < 1e-6
+    for k in (1, 2):
+        assert np.isnan(barrido.raiz[k])
+        assert barrido.estado[k] == SIN_CAMBIO_SIGNO
+
+
+def test_sustituto_con_parametros_no_finitos():
+    sustituto = construir(familia_exponencial, 0, 80, 1.5)
+    consulta = sustituto.consultar(math.nan)
+    assert math.isnan(consulta.raiz) and consulta.estado == MAX_ITERACIONES
+
+    lote = sustituto.consultar_lote([math.nan, 20.0, math.inf], pulir=True)
+    assert lote.estado.tolist() == [MAX_ITERACIONES, CONVERGIDO, MAX_ITERACIONES]
+    assert abs(lote.raiz[1] - 3.208220) < 1e-6